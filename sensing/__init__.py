@@ -3,14 +3,17 @@
 from sensing.gnss import GNSSData, GNSSReader
 from sensing.imu import IMUData, IMUReader
 from sensing.nmea import (
+    GGABatch,
     GGAData,
     VTGData,
     parse_gga,
+    parse_gga_batch,
     parse_vtg,
     validate_checksum,
 )
 
 __all__ = [
+    "GGABatch",
     "GGAData",
     "GNSSData",
     "GNSSReader",
@@ -18,6 +21,7 @@ __all__ = [
     "IMUReader",
     "VTGData",
     "parse_gga",
+    "parse_gga_batch",
     "parse_vtg",
     "validate_checksum",
 ]
@@ -16,11 +16,11 @@ Reading strategy:
 import contextlib
 import json
 import socket
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from enum import IntEnum
 from io import BufferedReader
 from types import TracebackType
-from typing import Any
+from typing import Any, ClassVar
 
 from sensing.gnss.types import GNSSData
 from sensing.nmea.types import GGAData, VTGData
@@ -226,6 +226,8 @@ class GNSSReader:
         try:
             sock.settimeout(_TIMEOUT)
             sock.sendall(_WATCH_CMD)
+            # A buffered binary stream: each recv() pulls in as many pending
+            # lines as fit the buffer, and readline() serves them from memory.
             return sock, sock.makefile("rb")
         except Exception:
             with contextlib.suppress(OSError):
@@ -288,8 +290,12 @@ class GNSSReader:
         except OSError as e:
             raise EOFError("gpsd connection closed.") from e
 
-    def _read_line(self) -> str | None:
-        """Read and decode one JSON line; returns ``None`` on timeout retry.
+    def _read_line(self) -> bytes | None:
+        """Read one raw JSON line; returns ``None`` on timeout retry.
+
+        The line is returned as received. ``json.loads`` accepts UTF-8
+        ``bytes`` and skips surrounding whitespace itself, so decoding and
+        stripping here would only copy the line twice more.
 
         Raises:
             RuntimeError: If called outside a ``with`` block.
@@ -300,9 +306,7 @@ class GNSSReader:
         raw = self._recv_raw(self._stream)
         if raw is None and self._cancelled:
             raise EOFError("gpsd read cancelled.")
-        if raw is None:
-            return None
-        return raw.decode("utf-8", errors="ignore").strip()
+        return raw
 
     def _process_sky(self, msg: dict[str, Any]) -> None:
         """Update stored satellite count and HDOP from a SKY message."""
@@ -357,21 +361,37 @@ class GNSSReader:
         vtg = self._build_vtg(msg, status)
         return GNSSData(gga=gga, vtg=vtg)
 
-    def _dispatch(self, line: str) -> GNSSData | None:
+    # gpsd message class -> handler; classes not listed here are ignored.
+    # One dict probe per line replaces a chain of string comparisons.
+    _MESSAGE_HANDLERS: ClassVar[
+        dict[str, Callable[["GNSSReader", dict[str, Any]], GNSSData | None]]
+    ] = {
+        "SKY": _process_sky,
+        "TPV": _process_tpv,
+    }
+
+    def _dispatch(self, line: bytes) -> GNSSData | None:
         """Parse one JSON line, update state, and return data on TPV."""
         try:
             parsed = json.loads(line)
-        except json.JSONDecodeError:
+        except UnicodeDecodeError:
+            # Rare slow path: drop stray invalid bytes rather than the whole
+            # line, so a TPV with a corrupt byte still yields its fix.
+            try:
+                parsed = json.loads(line.decode("utf-8", errors="ignore"))
+            except ValueError:
+                return None
+        except ValueError:
             return None
         if not isinstance(parsed, dict):
             return None
         msg: dict[str, Any] = parsed
         cls = msg.get("class")
-        if cls == "SKY":
-            self._process_sky(msg)
-        elif cls == "TPV":
-            return self._process_tpv(msg)
-        return None
+        # Guard the lookup: a non-string class (e.g. a list) is unhashable
+        handler = self._MESSAGE_HANDLERS.get(cls) if isinstance(cls, str) else None
+        if handler is None:
+            return None
+        return handler(self, msg)
 
     def read(self) -> GNSSData:
         """Block until the next TPV message and return a combined GNSS sample.
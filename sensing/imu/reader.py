@@ -58,6 +58,15 @@ _ACCEL_SENSITIVITY: float = 0.061e-3 * 9.80665  # m/s² per LSB
 # Gyroscope FS=±2000 dps: 70 mdps/LSB
 _GYRO_SENSITIVITY: float = 70.0e-3 * (math.pi / 180.0)  # rad/s per LSB
 
+# --- Output register layout --------------------------------------------------
+# Six little-endian int16 values: gyro X/Y/Z followed by accel X/Y/Z.
+# Compiled once so the format string is not re-parsed for every sample.
+_SAMPLE_STRUCT = struct.Struct("<hhhhhh")
+
+# Burst-read command: OUTX_L_G with the read bit set, then 12 dummy bytes to
+# clock out the output registers. Immutable, so one instance serves every read.
+_READ_SAMPLE_COMMAND: tuple[int, ...] = (_REG_OUTX_L_G | 0x80,) + (0x00,) * 12
+
 
 # --- Private hardware helpers ------------------------------------------------
 
@@ -93,6 +102,28 @@ def _start_imu(spi: spidev.SpiDev) -> None:
     spi.xfer2([_REG_CTRL1_XL, 0x40])  # Accel 104 Hz, FS=±2g  (starts cycle)
 
 
+def _build_imu_data(counts: tuple[int, ...], timestamp_ns: int) -> IMUData:
+    """Scale six raw register counts into an IMUData with physical units.
+
+    Args:
+        counts: Gyro X/Y/Z followed by accel X/Y/Z, as signed LSB counts.
+        timestamp_ns: CLOCK_REALTIME nanoseconds of the DRDY edge.
+
+    Returns:
+        IMUData with accelerometer values in m/s² and gyroscope in rad/s.
+    """
+    gx, gy, gz, ax, ay, az = counts
+    return IMUData(
+        timestamp_ns=timestamp_ns,
+        accel_x=ax * _ACCEL_SENSITIVITY,
+        accel_y=ay * _ACCEL_SENSITIVITY,
+        accel_z=az * _ACCEL_SENSITIVITY,
+        gyro_x=gx * _GYRO_SENSITIVITY,
+        gyro_y=gy * _GYRO_SENSITIVITY,
+        gyro_z=gz * _GYRO_SENSITIVITY,
+    )
+
+
 def _parse_sample(raw: bytes, timestamp_ns: int) -> IMUData:
     """Convert 12 raw output register bytes into an IMUData with physical units.
 
@@ -110,25 +141,19 @@ def _parse_sample(raw: bytes, timestamp_ns: int) -> IMUData:
     Returns:
         IMUData with accelerometer values in m/s² and gyroscope in rad/s.
     """
-    gx, gy, gz, ax, ay, az = struct.unpack("<hhhhhh", raw)
-    return IMUData(
-        timestamp_ns=timestamp_ns,
-        accel_x=ax * _ACCEL_SENSITIVITY,
-        accel_y=ay * _ACCEL_SENSITIVITY,
-        accel_z=az * _ACCEL_SENSITIVITY,
-        gyro_x=gx * _GYRO_SENSITIVITY,
-        gyro_y=gy * _GYRO_SENSITIVITY,
-        gyro_z=gz * _GYRO_SENSITIVITY,
-    )
+    return _build_imu_data(_SAMPLE_STRUCT.unpack(raw), timestamp_ns)
 
 
 def _read_sample(spi: spidev.SpiDev, timestamp_ns: int) -> IMUData:
-    """Issue a 12-byte SPI burst read and delegate conversion to _parse_sample.
+    """Issue a 12-byte SPI burst read and convert the response to an IMUData.
 
     Sends a single read command starting at OUTX_L_G (0x22) with the read
     bit set (bit 7). Auto-increment (IF_INC=1) must be enabled beforehand so
     the device streams all 12 output registers in one transfer.
 
+    The first response byte is clocked out while the command is sent and
+    carries no data, so the sample is unpacked starting at offset 1.
+
     Args:
         spi: Open SpiDev instance with IF_INC enabled.
         timestamp_ns: CLOCK_REALTIME nanoseconds captured by the kernel at the
@@ -137,9 +162,8 @@ def _read_sample(spi: spidev.SpiDev, timestamp_ns: int) -> IMUData:
     Returns:
         IMUData with accelerometer values in m/s² and gyroscope in rad/s.
     """
-    msg = [_REG_OUTX_L_G | 0x80] + [0x00] * 12
-    resp = spi.xfer2(msg)
-    return _parse_sample(bytes(resp[1:13]), timestamp_ns)
+    resp = spi.xfer2(_READ_SAMPLE_COMMAND)
+    return _build_imu_data(_SAMPLE_STRUCT.unpack_from(bytes(resp), 1), timestamp_ns)
 
 
 # --- Public API --------------------------------------------------------------
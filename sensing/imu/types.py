@@ -19,6 +19,10 @@ class IMUData:
         gyro_y: Angular rate around Y-axis in rad/s.
         gyro_z: Angular rate around Z-axis in rad/s.
 
+    The ``accel`` and ``gyro`` properties group the per-axis values into
+    (x, y, z) tuples for code that consumes whole vectors, e.g. stacking
+    samples into an (N, 3) array.
+
     Example:
         >>> with IMUReader() as imu:
         ...     sample = imu.read()
@@ -35,3 +39,13 @@ class IMUData:
     gyro_x: float
     gyro_y: float
     gyro_z: float
+
+    @property
+    def accel(self) -> tuple[float, float, float]:
+        """Acceleration vector (x, y, z) in m/s²."""
+        return (self.accel_x, self.accel_y, self.accel_z)
+
+    @property
+    def gyro(self) -> tuple[float, float, float]:
+        """Angular rate vector (x, y, z) in rad/s."""
+        return (self.gyro_x, self.gyro_y, self.gyro_z)
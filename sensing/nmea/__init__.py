@@ -1,14 +1,16 @@
 """NMEA 0183 parser for GGA and VTG sentences."""
 
 from sensing.nmea.checksum import validate_checksum
-from sensing.nmea.gga import parse_gga
-from sensing.nmea.types import GGAData, VTGData
+from sensing.nmea.gga import parse_gga, parse_gga_batch
+from sensing.nmea.types import GGABatch, GGAData, VTGData
 from sensing.nmea.vtg import parse_vtg
 
 __all__ = [
+    "GGABatch",
     "GGAData",
     "VTGData",
     "parse_gga",
+    "parse_gga_batch",
     "parse_vtg",
     "validate_checksum",
 ]
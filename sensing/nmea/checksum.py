@@ -10,50 +10,67 @@ Example sentence structure:
     start                                                          checksum (0x7F = 127)
 """
 
+import functools
+import operator
 
-def _extract_checksum_parts(sentence: str) -> tuple[str, str] | None:
+# Every two-digit hex checksum, upper- or lowercase, mapped to its value.
+# One dict probe decodes the digits and rejects anything that is not exactly
+# two hex digits; int(..., 16) would also accept forms like " 7" or "+7".
+_HEX_DIGITS = b"0123456789ABCDEFabcdef"
+_CHECKSUM_VALUES: dict[bytes, int] = {
+    bytes((high, low)): int(bytes((high, low)), 16)
+    for high in _HEX_DIGITS
+    for low in _HEX_DIGITS
+}
+
+
+def _extract_checksum_parts(sentence: bytes) -> tuple[bytes, bytes] | None:
     """Extract the payload content and provided checksum from an NMEA sentence.
 
     NMEA sentences follow the format: $<content>*<checksum>
     This function separates these components for validation.
 
     Args:
-        sentence: Raw NMEA sentence string (e.g., "$GNGGA,...*7F")
+        sentence: Raw NMEA sentence bytes (e.g., b"$GNGGA,...*7F")
 
     Returns:
         A tuple of (content, checksum_hex) if the sentence has valid structure,
         or None if:
         - Missing '$' start delimiter
-        - Missing '*' checksum delimiter
-        - Checksum is not exactly 2 characters (truncated sentence)
+        - '*' checksum delimiter is not exactly 3 bytes from the end
+          (missing, truncated checksum, or trailing data after it)
+        - Content contains another '*'
 
     Example:
-        >>> _extract_checksum_parts("$GNGGA,123519*7F")
-        ('GNGGA,123519', '7F')
+        >>> _extract_checksum_parts(b"$GNGGA,123519*7F")
+        (b'GNGGA,123519', b'7F')
     """
-    if not sentence.startswith("$") or "*" not in sentence:
+    # The checksum is always the last two bytes once trailing whitespace is
+    # stripped, so both delimiters are checked at fixed offsets; the payload
+    # is then searched once to make sure that '*' is the only delimiter.
+    end = len(sentence) - 3
+    if end < 1 or sentence[0] != 0x24 or sentence[end] != 0x2A:  # '$', '*'
         return None
 
-    start = sentence.index("$") + 1
-    end = sentence.index("*")
-    content = sentence[start:end]
-    provided = sentence[end + 1 : end + 3]
-
-    if len(provided) != 2:
+    content = sentence[1:end]
+    if b"*" in content:
         return None
 
-    return content, provided
+    return content, sentence[end + 1 :]
 
 
-def _calculate_xor_checksum(content: str) -> int:
-    """Calculate the XOR checksum of a content string.
+def _calculate_xor_checksum(content: bytes) -> int:
+    """Calculate the XOR checksum of the content bytes.
 
     The NMEA checksum algorithm XORs the ASCII value of each character
     in the content. This is a simple error-detection mechanism that can
     detect single-bit errors and some multi-bit errors.
 
+    The bytes are reduced directly, so the per-byte loop runs inside
+    ``functools.reduce`` rather than as interpreted ``ord()`` calls.
+
     Args:
-        content: The string between '$' and '*' (exclusive)
+        content: The bytes between '$' and '*' (exclusive)
 
     Returns:
         Integer checksum value (0-255)
@@ -63,13 +80,65 @@ def _calculate_xor_checksum(content: str) -> int:
         ord('G') ^ ord('N') ^ ord('G') ^ ord('G') ^ ord('A')
         = 71 ^ 78 ^ 71 ^ 71 ^ 65 = ...
     """
-    result = 0
-    for character in content:
-        result ^= ord(character)
-    return result
+    return functools.reduce(operator.xor, content, 0)
+
+
+def extract_validated_content(
+    sentence: str | bytes, *, verify_checksum: bool = True
+) -> str | None:
+    """Validate the checksum and return the content it covers.
+
+    Combines checksum validation with payload extraction so sentence parsers
+    locate the '$' and '*' delimiters once, instead of validating first and
+    then slicing the same sentence again to get at the fields.
+
+    Args:
+        sentence: Complete NMEA sentence including '$', '*', and checksum,
+                  as text or as raw bytes read from the receiver.
+                  May include trailing whitespace/newlines (will be stripped).
+        verify_checksum: If False, skip the XOR and only require the
+                  '$...*XX' shape with a hexadecimal checksum. For sources
+                  whose transport already guarantees integrity.
+
+    Returns:
+        The content between '$' and '*' (exclusive) if the checksum is
+        valid, or None under the same conditions that make
+        validate_checksum return False.
 
+    Example:
+        >>> extract_validated_content("$GNVTG,054.7,T,034.4,M,005.5,N,010.2,K,A*3B")
+        'GNVTG,054.7,T,034.4,M,005.5,N,010.2,K,A'
+        >>> extract_validated_content("$GNVTG,054.7,...*FF")  # wrong checksum
+        None
+    """
+    # Delimiter search and the XOR both run on bytes, so byte input from a
+    # serial port or socket is never round-tripped through str; text input
+    # is encoded once. Only the validated content is decoded, for the parsers.
+    if isinstance(sentence, str):
+        try:
+            sentence = sentence.encode("ascii")
+        except UnicodeEncodeError:
+            return None
+
+    parts = _extract_checksum_parts(sentence.strip())
+    if parts is None:
+        return None
 
-def validate_checksum(sentence: str) -> bool:
+    content, provided = parts
+
+    expected = _CHECKSUM_VALUES.get(provided)
+    if expected is None:
+        return None
+    if verify_checksum and _calculate_xor_checksum(content) != expected:
+        return None
+
+    try:
+        return content.decode("ascii")
+    except UnicodeDecodeError:
+        return None
+
+
+def validate_checksum(sentence: str | bytes) -> bool:
     """Validate the checksum of an NMEA sentence.
 
     Performs end-to-end validation by:
@@ -78,13 +147,15 @@ def validate_checksum(sentence: str) -> bool:
     3. Comparing against the provided 2-digit hex checksum
 
     Args:
-        sentence: Complete NMEA sentence including '$', '*', and checksum.
+        sentence: Complete NMEA sentence including '$', '*', and checksum,
+                  as text or as raw bytes read from the receiver.
                   May include trailing whitespace/newlines (will be stripped).
 
     Returns:
         True if the checksum is valid, False if:
         - Sentence is malformed (missing delimiters)
         - Checksum is truncated or non-hexadecimal
+        - Content contains non-ASCII characters
         - Calculated checksum doesn't match provided checksum
 
     Example:
@@ -93,16 +164,4 @@ def validate_checksum(sentence: str) -> bool:
         >>> validate_checksum("$GNGGA,123519.00,...*FF")  # wrong checksum
         False
     """
-    sentence = sentence.strip()
-
-    parts = _extract_checksum_parts(sentence)
-    if parts is None:
-        return False
-
-    content, provided = parts
-
-    try:
-        calculated = _calculate_xor_checksum(content)
-        return calculated == int(provided, 16)
-    except ValueError:
-        return False
+    return extract_validated_content(sentence) is not None
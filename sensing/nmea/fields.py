@@ -17,6 +17,10 @@ allowing callers to distinguish "no data" from "zero value".
 #   GQ = QZSS (Japan)
 VALID_TALKER_IDS = ("GP", "GN", "GL", "GA", "GB", "GQ")
 
+# Regex alternation over VALID_TALKER_IDS. Sentence patterns embed it so the
+# constellation is checked by the same match that extracts the fields.
+TALKER_ID_REGEX = "|".join(VALID_TALKER_IDS)
+
 
 def parse_float_field(value: str) -> float | None:
     """Parse a string field to float, returning None if empty or invalid.
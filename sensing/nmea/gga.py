@@ -27,130 +27,128 @@ Fix Quality Values:
 """
 
 
-from sensing.nmea.checksum import validate_checksum
+import math
+import re
+from collections.abc import Iterable
+
+from sensing.nmea.checksum import extract_validated_content
 from sensing.nmea.fields import (
-    VALID_TALKER_IDS,
+    TALKER_ID_REGEX,
     convert_to_decimal_degrees,
     parse_float_field,
     parse_int_field,
     parse_string_field,
 )
-from sensing.nmea.types import GGAData
-
-# GGA sentences have 14 standard fields (indices 0-13)
-# Some receivers add extra fields for DGPS station info
-_MINIMUM_FIELD_COUNT = 14
-
-
-def _extract_fields(sentence: str) -> list[str] | None:
-    """Extract comma-separated fields from a validated GGA sentence.
-
-    Assumes the sentence has already passed checksum validation.
-    Extracts the content between '$' and '*', then splits by comma.
-
-    Args:
-        sentence: Checksum-validated NMEA sentence
-
-    Returns:
-        List of field strings, or None if fewer than 14 fields
-        (indicating a malformed or truncated sentence)
-
-    Example:
-        Input: "$GNGGA,123519.00,4807.038,N,...*7F"
-        Output: ["GNGGA", "123519.00", "4807.038", "N", ...]
-    """
-    content = sentence[1 : sentence.index("*")]
-    fields = content.split(",")
-
-    if len(fields) < _MINIMUM_FIELD_COUNT:
-        return None
-
-    return fields
+from sensing.nmea.types import GGABatch, GGAData
+
+# GGA sentences have 14 standard fields (indices 0-13). Some receivers add
+# extra fields for DGPS station info, which the trailing group tolerates.
+# The whole layout is matched in one pass, so field count, talker ID and
+# sentence type are checked by the pattern itself rather than by splitting.
+_GGA_PATTERN = re.compile(
+    rf"(?P<talker_id>{TALKER_ID_REGEX})GGA"
+    r",(?P<utc_time>[^,]*)"
+    r",(?P<latitude>[^,]*)"
+    r",(?P<latitude_direction>[^,]*)"
+    r",(?P<longitude>[^,]*)"
+    r",(?P<longitude_direction>[^,]*)"
+    r",(?P<fix_quality>[^,]*)"
+    r",(?P<num_satellites>[^,]*)"
+    r",(?P<hdop>[^,]*)"
+    r",(?P<altitude>[^,]*)"
+    r",[^,]*"  # altitude unit (M)
+    r",(?P<geoid_height>[^,]*)"
+    r",[^,]*"  # geoid height unit (M)
+    r",[^,]*"  # age of DGPS data
+    r"(?:,.*)?"  # DGPS station ID and any vendor extensions
+)
 
 
-def _validate_message_type(fields: list[str]) -> bool:
-    """Validate that this is a GGA sentence from a supported constellation.
+def _extract_fields(content: str) -> re.Match[str] | None:
+    """Match the fields of validated GGA content in a single pass.
 
-    Checks that:
-    1. The message type field has at least 5 characters (2 talker + 3 sentence)
-    2. The talker ID is a supported GNSS constellation
-    3. The sentence type is "GGA"
+    Assumes the content has already passed checksum validation and had its
+    '$' and '*' delimiters removed by extract_validated_content.
 
     Args:
-        fields: List of parsed NMEA fields
+        content: Checksum-validated content between '$' and '*'
 
     Returns:
-        True if valid GGA from supported constellation, False otherwise
+        Match object with one named group per GGA field, or None if the
+        content is not a GGA sentence from a supported constellation with
+        at least 14 fields (indicating a malformed, truncated, or different
+        sentence)
 
     Example:
-        fields[0] = "GNGGA" -> talker="GN", sentence="GGA" -> True
-        fields[0] = "XXGGA" -> talker="XX" (unsupported) -> False
-        fields[0] = "GNVTG" -> sentence="VTG" (not GGA) -> False
+        Input: "GNGGA,123519.00,4807.038,N,..."
+        Output: match with match["talker_id"] == "GN",
+                match["utc_time"] == "123519.00", ...
     """
-    message_type = fields[0]
-    if len(message_type) < 5:
-        return False
-
-    talker_id = message_type[:2]
-    sentence_type = message_type[2:]
-
-    return talker_id in VALID_TALKER_IDS and sentence_type == "GGA"
+    return _GGA_PATTERN.fullmatch(content)
 
 
-def _build_gga_data(fields: list[str]) -> GGAData:
-    """Construct a GGAData object from parsed fields.
+def _build_gga_data(fields: re.Match[str]) -> GGAData:
+    """Construct a GGAData object from matched fields.
 
-    Maps NMEA field indices to GGAData attributes:
-        fields[1]  -> utc_time (HHMMSS.ss format)
-        fields[2]  -> latitude (DDMM.MMMM format)
-        fields[3]  -> latitude direction (N/S)
-        fields[4]  -> longitude (DDDMM.MMMM format)
-        fields[5]  -> longitude direction (E/W)
-        fields[6]  -> fix_quality (0-6)
-        fields[7]  -> num_satellites
-        fields[8]  -> HDOP (horizontal dilution of precision)
-        fields[9]  -> altitude above MSL (meters)
-        fields[11] -> geoid height (meters)
+    Maps named GGA fields to GGAData attributes:
+        utc_time             -> utc_time (HHMMSS.ss format)
+        latitude             -> latitude (DDMM.MMMM format)
+        latitude_direction   -> latitude direction (N/S)
+        longitude            -> longitude (DDDMM.MMMM format)
+        longitude_direction  -> longitude direction (E/W)
+        fix_quality          -> fix_quality (0-6)
+        num_satellites       -> num_satellites
+        hdop                 -> HDOP (horizontal dilution of precision)
+        altitude             -> altitude above MSL (meters)
+        geoid_height         -> geoid height (meters)
 
     Note: fix_quality defaults to 0 (invalid) if the field is empty,
     since 0 already means "no fix" semantically.
 
     Args:
-        fields: List of parsed NMEA fields (minimum 14 elements)
+        fields: Match object produced by _extract_fields
 
     Returns:
         GGAData with parsed values; valid=True only if fix_quality > 0
     """
     # Default fix_quality to 0 (invalid) if field is empty
     # This is semantically correct: empty fix quality means no fix
-    fix_quality = parse_int_field(fields[6]) or 0
+    fix_quality = parse_int_field(fields["fix_quality"]) or 0
 
     return GGAData(
-        utc_time=parse_string_field(fields[1]),
-        latitude_degrees=convert_to_decimal_degrees(fields[2], fields[3]),
-        longitude_degrees=convert_to_decimal_degrees(fields[4], fields[5]),
+        utc_time=parse_string_field(fields["utc_time"]),
+        latitude_degrees=convert_to_decimal_degrees(
+            fields["latitude"], fields["latitude_direction"]
+        ),
+        longitude_degrees=convert_to_decimal_degrees(
+            fields["longitude"], fields["longitude_direction"]
+        ),
         fix_quality=fix_quality,
-        num_satellites=parse_int_field(fields[7]),
-        horizontal_dilution_of_precision=parse_float_field(fields[8]),
-        altitude_meters=parse_float_field(fields[9]),
-        geoid_height_meters=parse_float_field(fields[11]),
+        num_satellites=parse_int_field(fields["num_satellites"]),
+        horizontal_dilution_of_precision=parse_float_field(fields["hdop"]),
+        altitude_meters=parse_float_field(fields["altitude"]),
+        geoid_height_meters=parse_float_field(fields["geoid_height"]),
         # Navigation validity: only valid if we have a fix
         valid=fix_quality > 0,
     )
 
 
-def parse_gga(sentence: str) -> GGAData | None:
+def parse_gga(
+    sentence: str | bytes, *, verify_checksum: bool = True
+) -> GGAData | None:
     """Parse a GGA sentence into structured data.
 
     This is the main entry point for GGA parsing. It performs:
-    1. Whitespace stripping (handles \\r\\n line endings)
-    2. Checksum validation
-    3. Field extraction and count validation
-    4. Message type validation (must be GGA from supported constellation)
-    5. Field parsing and coordinate conversion
+    1. Checksum validation and content extraction in one step
+       (handles \\r\\n line endings)
+    2. Single-pass field matching (field count, supported talker ID and
+       "GGA" sentence type)
+    3. Field parsing and coordinate conversion
 
     Args:
-        sentence: Raw NMEA GGA sentence string
+        sentence: Raw NMEA GGA sentence, as a string or as ASCII bytes
+        verify_checksum: If False, skip the XOR checksum and only check the
+            trailing '*XX' shape
 
     Returns:
         GGAData object if parsing succeeds, or None if:
@@ -172,19 +170,74 @@ def parse_gga(sentence: str) -> GGAData | None:
         >>> result.valid
         True
     """
-    sentence = sentence.strip()
-
-    if not validate_checksum(sentence):
+    content = extract_validated_content(sentence, verify_checksum=verify_checksum)
+    if content is None:
         return None
 
     try:
-        fields = _extract_fields(sentence)
+        fields = _extract_fields(content)
         if fields is None:
             return None
 
-        if not _validate_message_type(fields):
-            return None
-
         return _build_gga_data(fields)
     except (ValueError, IndexError):
         return None
+
+
+# Inclusive upper bound of the 'h' count columns in GGABatch
+_BATCH_COUNT_MAX = 0x7FFF
+
+
+def _float_or_nan(value: float | None) -> float:
+    """Map a missing float field to NaN for storage in a typed array."""
+    return math.nan if value is None else value
+
+
+def parse_gga_batch(
+    sentences: Iterable[str | bytes], *, verify_checksum: bool = True
+) -> GGABatch:
+    """Parse many GGA sentences into one columnar GGABatch.
+
+    Each sentence goes through parse_gga, so the accepted input and the
+    parsed values are identical; only the storage layout differs. Sentences
+    that parse_gga rejects, or whose counts do not fit the integer columns,
+    are skipped; source_index gives each row's position in the input.
+
+    Args:
+        sentences: Raw NMEA GGA sentences, as strings or as ASCII bytes
+        verify_checksum: Forwarded to parse_gga for every sentence
+
+    Returns:
+        GGABatch with one row per stored sentence, in input order
+
+    Example:
+        >>> batch = parse_gga_batch(log_file)  # one sentence per line
+        >>> fixed = [i for i, ok in zip(batch.source_index, batch.valid) if ok]
+    """
+    batch = GGABatch()
+    for index, sentence in enumerate(sentences):
+        gga = parse_gga(sentence, verify_checksum=verify_checksum)
+        if gga is None:
+            continue
+        # Negative parsed counts are rejected so -1 can only mean "empty"
+        if not 0 <= gga.fix_quality <= _BATCH_COUNT_MAX:
+            continue
+        if gga.num_satellites is None:
+            num_satellites = -1
+        elif 0 <= gga.num_satellites <= _BATCH_COUNT_MAX:
+            num_satellites = gga.num_satellites
+        else:
+            continue
+        batch.source_index.append(index)
+        batch.utc_time.append(gga.utc_time)
+        batch.latitude_degrees.append(_float_or_nan(gga.latitude_degrees))
+        batch.longitude_degrees.append(_float_or_nan(gga.longitude_degrees))
+        batch.fix_quality.append(gga.fix_quality)
+        batch.num_satellites.append(num_satellites)
+        batch.horizontal_dilution_of_precision.append(
+            _float_or_nan(gga.horizontal_dilution_of_precision)
+        )
+        batch.altitude_meters.append(_float_or_nan(gga.altitude_meters))
+        batch.geoid_height_meters.append(_float_or_nan(gga.geoid_height_meters))
+        batch.valid.append(gga.valid)
+    return batch
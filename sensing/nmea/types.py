@@ -15,12 +15,18 @@ Design Decisions:
 
     3. fix_quality as int (not Optional): The value 0 already means "invalid"
        in the NMEA spec, so there's no semantic difference between "empty" and "0".
+
+    4. Slotted, not frozen, sentence types: __slots__ drops the per-instance
+       __dict__ for every sentence parsed from a stream. frozen=True is left
+       off because its __init__ assigns each field through
+       object.__setattr__, which made construction about four times slower.
 """
 
-from dataclasses import dataclass
+from array import array
+from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True)
 class GGAData:
     """Parsed GGA (Global Positioning System Fix Data) sentence.
 
@@ -88,7 +94,7 @@ class GGAData:
     valid: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class VTGData:
     """Parsed VTG (Track Made Good and Ground Speed) sentence.
 
@@ -145,3 +151,60 @@ class VTGData:
     speed_meters_per_second: float | None
     mode: str | None
     valid: bool
+
+
+@dataclass
+class GGABatch:
+    """Many parsed GGA sentences stored column by column.
+
+    Each numeric attribute is a typed ``array.array`` holding one GGAData
+    field for every row in the batch, in input order. Batch consumers
+    (log ingestion, filtering, export) read contiguous machine values instead
+    of walking one GGAData object per fix, and the buffers can be handed to
+    anything that speaks the buffer protocol without copying.
+
+    Sentences that parse_gga rejects get no row, and neither do sentences
+    whose fix_quality or num_satellites falls outside 0-32767, the range of
+    the integer columns. source_index records which input each row came
+    from, so rows can still be mapped back to log lines.
+
+    Missing values cannot be None in a typed array, so they are stored as
+    NaN in the float columns and as -1 in num_satellites; parsed negative
+    counts are out of range, so -1 is never a real value.
+
+    Attributes:
+        source_index: Position of each row's sentence in the input ('q').
+        utc_time: UTC timestamps in HHMMSS.ss format, None if empty. A plain
+            list, since strings have no typed-array representation.
+        latitude_degrees: Latitudes in decimal degrees ('d').
+        longitude_degrees: Longitudes in decimal degrees ('d').
+        fix_quality: Fix quality indicators ('h').
+        num_satellites: Satellites used in the fix, -1 if empty ('h').
+        horizontal_dilution_of_precision: HDOP values ('d').
+        altitude_meters: Altitudes above mean sea level ('d').
+        geoid_height_meters: Geoid separations ('d').
+        valid: Navigation validity flags as 0/1 ('B').
+
+    Example:
+        >>> batch = parse_gga_batch(sentences)
+        >>> len(batch)
+        3
+        >>> batch.fix_quality.tolist()
+        [1, 4, 0]
+    """
+
+    source_index: array[int] = field(default_factory=lambda: array("q"))
+    utc_time: list[str | None] = field(default_factory=list)
+    latitude_degrees: array[float] = field(default_factory=lambda: array("d"))
+    longitude_degrees: array[float] = field(default_factory=lambda: array("d"))
+    fix_quality: array[int] = field(default_factory=lambda: array("h"))
+    num_satellites: array[int] = field(default_factory=lambda: array("h"))
+    horizontal_dilution_of_precision: array[float] = field(
+        default_factory=lambda: array("d")
+    )
+    altitude_meters: array[float] = field(default_factory=lambda: array("d"))
+    geoid_height_meters: array[float] = field(default_factory=lambda: array("d"))
+    valid: array[int] = field(default_factory=lambda: array("B"))
+
+    def __len__(self) -> int:
+        return len(self.source_index)
@@ -23,80 +23,66 @@ Note: When stationary, the track angle may be empty (no heading when not moving)
 """
 
 
-from sensing.nmea.checksum import validate_checksum
+import re
+
+from sensing.nmea.checksum import extract_validated_content
 from sensing.nmea.fields import (
-    VALID_TALKER_IDS,
+    TALKER_ID_REGEX,
     parse_float_field,
     parse_string_field,
 )
 from sensing.nmea.types import VTGData
 
-# VTG has 9 fields in basic format, 10 with FAA mode indicator
-_MINIMUM_FIELD_COUNT = 9
+# VTG has 9 fields in basic format, 10 with the FAA mode indicator (NMEA 2.3+).
+# Compiled once at import and matched in one pass, so the field count, talker
+# ID and sentence type are checked by the pattern itself rather than by
+# splitting.
+_VTG_PATTERN = re.compile(
+    rf"(?P<talker_id>{TALKER_ID_REGEX})VTG"
+    r",(?P<track_true_degrees>[^,]*)"
+    r",[^,]*"  # T (true)
+    r",[^,]*"  # track relative to magnetic north
+    r",[^,]*"  # M (magnetic)
+    r",(?P<speed_knots>[^,]*)"
+    r",[^,]*"  # N (knots)
+    r",(?P<speed_kilometers_per_hour>[^,]*)"
+    r",[^,]*"  # K (km/h)
+    r"(?:,(?P<mode>[^,]*))?"  # FAA mode indicator, absent before NMEA 2.3
+    r"(?:,.*)?"  # vendor extensions
+)
 
 # Conversion factor: km/h to m/s
 # 1 km/h = 1000m / 3600s = 1/3.6 m/s
 _KILOMETERS_PER_HOUR_TO_METERS_PER_SECOND = 3.6
 
 
-def _extract_fields(sentence: str) -> list[str] | None:
-    """Extract comma-separated fields from a validated VTG sentence.
-
-    Assumes the sentence has already passed checksum validation.
-    Extracts the content between '$' and '*', then splits by comma.
-
-    Args:
-        sentence: Checksum-validated NMEA sentence
-
-    Returns:
-        List of field strings, or None if fewer than 9 fields
-        (indicating a malformed or truncated sentence)
-
-    Example:
-        Input: "$GNVTG,054.7,T,034.4,M,005.5,N,010.2,K,A*3B"
-        Output: ["GNVTG", "054.7", "T", "034.4", "M", "005.5", "N", "010.2", "K", "A"]
-    """
-    content = sentence[1 : sentence.index("*")]
-    fields = content.split(",")
-
-    if len(fields) < _MINIMUM_FIELD_COUNT:
-        return None
-
-    return fields
-
-
-def _validate_message_type(fields: list[str]) -> bool:
-    """Validate that this is a VTG sentence from a supported constellation.
+def _extract_fields(content: str) -> re.Match[str] | None:
+    """Match the fields of validated VTG content in a single pass.
 
-    Checks that:
-    1. The message type field has at least 5 characters (2 talker + 3 sentence)
-    2. The talker ID is a supported GNSS constellation
-    3. The sentence type is "VTG"
+    Assumes the content has already passed checksum validation and had its
+    '$' and '*' delimiters removed by extract_validated_content.
 
     Args:
-        fields: List of parsed NMEA fields
+        content: Checksum-validated content between '$' and '*'
 
     Returns:
-        True if valid VTG from supported constellation, False otherwise
+        Match object with one named group per VTG field, or None if the
+        content is not a VTG sentence from a supported constellation with
+        at least 9 fields (indicating a malformed, truncated, or different
+        sentence)
 
     Example:
-        fields[0] = "GNVTG" -> talker="GN", sentence="VTG" -> True
-        fields[0] = "GNGGA" -> sentence="GGA" (not VTG) -> False
+        Input: "GNVTG,054.7,T,034.4,M,005.5,N,010.2,K,A"
+        Output: match with match["talker_id"] == "GN",
+                match["speed_knots"] == "005.5", match["mode"] == "A", ...
     """
-    message_type = fields[0]
-    if len(message_type) < 5:
-        return False
+    return _VTG_PATTERN.fullmatch(content)
 
-    talker_id = message_type[:2]
-    sentence_type = message_type[2:]
 
-    return talker_id in VALID_TALKER_IDS and sentence_type == "VTG"
-
-
-def _extract_mode(fields: list[str]) -> str | None:
+def _extract_mode(fields: re.Match[str]) -> str | None:
     """Extract the FAA mode indicator from VTG fields.
 
-    The mode indicator was added in NMEA 2.3 and appears at index 9.
+    The mode indicator was added in NMEA 2.3 and is the 10th field.
     Older receivers may not include this field.
 
     Mode values:
@@ -106,14 +92,15 @@ def _extract_mode(fields: list[str]) -> str | None:
         N = Not valid
 
     Args:
-        fields: List of parsed NMEA fields
+        fields: Match object produced by _extract_fields
 
     Returns:
         Single-character mode string, or None if field is missing/empty
     """
-    if len(fields) <= 9:
+    mode = fields["mode"]
+    if mode is None:
         return None
-    return parse_string_field(fields[9])
+    return parse_string_field(mode)
 
 
 def _compute_speed_meters_per_second(
@@ -141,32 +128,32 @@ def _compute_speed_meters_per_second(
     return speed_kilometers_per_hour / _KILOMETERS_PER_HOUR_TO_METERS_PER_SECOND
 
 
-def _build_vtg_data(fields: list[str]) -> VTGData:
-    """Construct a VTGData object from parsed fields.
+def _build_vtg_data(fields: re.Match[str]) -> VTGData:
+    """Construct a VTGData object from matched fields.
 
-    Maps NMEA field indices to VTGData attributes:
-        fields[1] -> track_true_degrees (heading relative to true north)
-        fields[5] -> speed_knots
-        fields[7] -> speed_kilometers_per_hour
-        (computed) -> speed_meters_per_second (derived from km/h)
-        fields[9] -> mode (FAA mode indicator, if present)
+    Maps named VTG fields to VTGData attributes:
+        track_true_degrees        -> track_true_degrees (heading, true north)
+        speed_knots               -> speed_knots
+        speed_kilometers_per_hour -> speed_kilometers_per_hour
+        (computed)                -> speed_meters_per_second (from km/h)
+        mode                      -> mode (FAA mode indicator, if present)
 
     Navigation validity is determined by the mode indicator:
     - valid=True if mode is A (autonomous) or D (differential)
     - valid=False if mode is N (not valid), E (estimated), or missing
 
     Args:
-        fields: List of parsed NMEA fields (minimum 9 elements)
+        fields: Match object produced by _extract_fields
 
     Returns:
         VTGData with parsed values and computed validity
     """
-    speed_kilometers_per_hour = parse_float_field(fields[7])
+    speed_kilometers_per_hour = parse_float_field(fields["speed_kilometers_per_hour"])
     mode = _extract_mode(fields)
 
     return VTGData(
-        track_true_degrees=parse_float_field(fields[1]),
-        speed_knots=parse_float_field(fields[5]),
+        track_true_degrees=parse_float_field(fields["track_true_degrees"]),
+        speed_knots=parse_float_field(fields["speed_knots"]),
         speed_kilometers_per_hour=speed_kilometers_per_hour,
         speed_meters_per_second=_compute_speed_meters_per_second(
             speed_kilometers_per_hour
@@ -177,18 +164,22 @@ def _build_vtg_data(fields: list[str]) -> VTGData:
     )
 
 
-def parse_vtg(sentence: str) -> VTGData | None:
+def parse_vtg(
+    sentence: str | bytes, *, verify_checksum: bool = True
+) -> VTGData | None:
     """Parse a VTG sentence into structured data.
 
     This is the main entry point for VTG parsing. It performs:
-    1. Whitespace stripping (handles \\r\\n line endings)
-    2. Checksum validation
-    3. Field extraction and count validation
-    4. Message type validation (must be VTG from supported constellation)
-    5. Field parsing and unit conversion
+    1. Checksum validation and content extraction in one step
+       (handles \\r\\n line endings)
+    2. Single-pass field matching (field count, supported talker ID and
+       "VTG" sentence type)
+    3. Field parsing and unit conversion
 
     Args:
-        sentence: Raw NMEA VTG sentence string
+        sentence: Raw NMEA VTG sentence, as a string or as ASCII bytes
+        verify_checksum: If False, skip the XOR checksum and only check the
+            trailing '*XX' shape
 
     Returns:
         VTGData object if parsing succeeds, or None if:
@@ -210,19 +201,15 @@ def parse_vtg(sentence: str) -> VTGData | None:
         >>> result.valid
         True
     """
-    sentence = sentence.strip()
-
-    if not validate_checksum(sentence):
+    content = extract_validated_content(sentence, verify_checksum=verify_checksum)
+    if content is None:
         return None
 
     try:
-        fields = _extract_fields(sentence)
+        fields = _extract_fields(content)
         if fields is None:
             return None
 
-        if not _validate_message_type(fields):
-            return None
-
         return _build_vtg_data(fields)
     except (ValueError, IndexError):
         return None
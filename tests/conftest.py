@@ -0,0 +1,7 @@
+"""Pytest configuration shared by every test package."""
+
+import pytest
+
+# Shared assertion helpers live outside the test modules pytest rewrites by
+# default; register them so their failures report the compared values.
+pytest.register_assert_rewrite("tests.helpers")
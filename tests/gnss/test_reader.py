@@ -10,7 +10,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from sensing.gnss import GNSSData, GNSSReader
-from sensing.nmea.types import GGAData, VTGData
+from tests.helpers import assert_close, make_gga, make_vtg
 
 # ---------------------------------------------------------------------------
 # gpsd JSON message dictionaries
@@ -135,7 +135,7 @@ _WATCH_MSG = {"class": "WATCH", "enable": True}
 _VERSION_MSG = {"class": "VERSION", "release": "3.25"}
 
 # An obviously malformed line
-_GARBAGE = "not-json-at-all"
+_GARBAGE = b"not-json-at-all\n"
 
 
 # ---------------------------------------------------------------------------
@@ -148,31 +148,73 @@ def _line(msg: dict) -> bytes:
     return (json.dumps(msg) + "\n").encode()
 
 
+# ---------------------------------------------------------------------------
+# Pre-encoded lines for the message constants (encoded once at import)
+# ---------------------------------------------------------------------------
+
+_TPV_RTK_LINE = _line(_TPV_RTK)
+_TPV_SPS_LINE = _line(_TPV_SPS)
+_TPV_DGPS_LINE = _line(_TPV_DGPS)
+_TPV_NO_FIX_LINE = _line(_TPV_NO_FIX)
+_SKY_12_LINE = _line(_SKY_12)
+_SKY_NSAT_ONLY_LINE = _line(_SKY_NSAT_ONLY)
+_SKY_SATELLITES_WITH_FLAGS_LINE = _line(_SKY_SATELLITES_WITH_FLAGS)
+_SKY_SATELLITES_NO_USED_FLAG_LINE = _line(_SKY_SATELLITES_NO_USED_FLAG)
+_TPV_MODE3_NO_STATUS_LINE = _line(_TPV_MODE3_NO_STATUS)
+_TPV_MODE2_NO_STATUS_LINE = _line(_TPV_MODE2_NO_STATUS)
+_TPV_MODE1_NO_STATUS_LINE = _line(_TPV_MODE1_NO_STATUS)
+_TPV_MODE0_NO_STATUS_LINE = _line(_TPV_MODE0_NO_STATUS)
+_TPV_NO_STATUS_NO_MODE_LINE = _line(_TPV_NO_STATUS_NO_MODE)
+_WATCH_MSG_LINE = _line(_WATCH_MSG)
+_VERSION_MSG_LINE = _line(_VERSION_MSG)
+
+
 # ---------------------------------------------------------------------------
 # Fixture
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def patched_connect():
+    """Patch socket.create_connection once for the whole module.
+
+    ``mock_gpsd`` resets this mock and rewires it to a fresh socket mock
+    before every test, so no state leaks between tests.
+    """
+    mock_connect = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(socket, "create_connection", mock_connect)
+        yield mock_connect
+
+
 @pytest.fixture
-def mock_gpsd(monkeypatch):
-    """Replace socket.create_connection with a mock for the duration of a test.
+def mock_gpsd(patched_connect):
+    """Provide a fresh gpsd socket mock for the duration of a test.
 
     Returns a SimpleNamespace with attributes:
         sock     -- the socket instance mock
         stream   -- the stream mock returned by sock.makefile()
         connect  -- the create_connection mock (to verify call args)
+        feed     -- queue encoded gpsd lines as successive readline() results
 
-    Configure ``stream.readline.side_effect`` with a list of byte strings
-    to control what the reader sees.  A trailing ``OSError`` simulates a
-    closed connection; omit it when the test reads only a fixed number of
-    messages and will not exhaust the list.
+    By default ``readline()`` returns ``b""`` forever, which the reader treats
+    as a closed connection.  ``feed(*lines)`` serves the given lines first
+    and then falls back to that EOF tail, so tests only state their prefix.
+    Set ``stream.readline.side_effect`` directly to inject exceptions.
     """
     mock_stream = MagicMock()
+    mock_stream.readline.side_effect = itertools.repeat(b"")
     mock_sock = MagicMock()
     mock_sock.makefile.return_value = mock_stream
-    mock_connect = MagicMock(return_value=mock_sock)
-    monkeypatch.setattr(socket, "create_connection", mock_connect)
-    return SimpleNamespace(sock=mock_sock, stream=mock_stream, connect=mock_connect)
+    patched_connect.reset_mock(return_value=True, side_effect=True)
+    patched_connect.return_value = mock_sock
+
+    def feed(*lines: bytes) -> None:
+        mock_stream.readline.side_effect = itertools.chain(lines, itertools.repeat(b""))
+
+    return SimpleNamespace(
+        sock=mock_sock, stream=mock_stream, connect=patched_connect, feed=feed
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -182,14 +224,14 @@ def mock_gpsd(monkeypatch):
 
 class TestGNSSData:
     def test_holds_gga_and_vtg(self):
-        gga = MagicMock(spec=GGAData)
-        vtg = MagicMock(spec=VTGData)
+        gga = make_gga()
+        vtg = make_vtg()
         data = GNSSData(gga=gga, vtg=vtg)
         assert data.gga is gga
         assert data.vtg is vtg
 
     def test_vtg_defaults_to_none(self):
-        gga = MagicMock(spec=GGAData)
+        gga = make_gga()
         data = GNSSData(gga=gga)
         assert data.vtg is None
 
@@ -212,13 +254,13 @@ class TestGNSSReaderErrors:
 
 class TestGNSSReaderSetup:
     def test_connects_to_default_host_and_port(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_SPS)]
+        mock_gpsd.feed(_TPV_SPS_LINE)
         with GNSSReader() as gnss:
             gnss.read()
         mock_gpsd.connect.assert_called_once_with(("localhost", 2947))
 
     def test_sends_watch_command_on_enter(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_SPS)]
+        mock_gpsd.feed(_TPV_SPS_LINE)
         with GNSSReader() as gnss:
             gnss.read()
         mock_gpsd.sock.sendall.assert_called_once_with(
@@ -226,13 +268,19 @@ class TestGNSSReaderSetup:
         )
 
     def test_custom_host_and_port_are_forwarded(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_SPS)]
+        mock_gpsd.feed(_TPV_SPS_LINE)
         with GNSSReader(host="192.168.1.10", port=2948) as gnss:
             gnss.read()
         mock_gpsd.connect.assert_called_once_with(("192.168.1.10", 2948))
 
+    def test_reads_through_buffered_binary_stream(self, mock_gpsd):
+        mock_gpsd.feed(_TPV_SPS_LINE)
+        with GNSSReader() as gnss:
+            gnss.read()
+        mock_gpsd.sock.makefile.assert_called_once_with("rb")
+
     def test_socket_timeout_is_set_on_enter(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_SPS)]
+        mock_gpsd.feed(_TPV_SPS_LINE)
         with GNSSReader() as gnss:
             gnss.read()
         mock_gpsd.sock.settimeout.assert_called_once()
@@ -251,109 +299,109 @@ class TestGNSSReaderSetup:
 
 class TestGNSSReaderRead:
     def test_returns_gnss_data_instance(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_SPS)]
+        mock_gpsd.feed(_TPV_SPS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert isinstance(data, GNSSData)
 
     def test_gga_fields_from_rtk_tpv(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_RTK)]
+        mock_gpsd.feed(_TPV_RTK_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.fix_quality == 4  # status 3 -> fix_quality 4
-        assert data.gga.latitude_degrees == pytest.approx(48.1173, rel=1e-4)
-        assert data.gga.longitude_degrees == pytest.approx(11.5167, rel=1e-4)
-        assert data.gga.altitude_meters == pytest.approx(545.4, rel=1e-4)
+        assert_close(data.gga.latitude_degrees, 48.1173, rel=1e-4)
+        assert_close(data.gga.longitude_degrees, 11.5167, rel=1e-4)
+        assert_close(data.gga.altitude_meters, 545.4, rel=1e-4)
         assert data.gga.valid is True
 
     def test_no_fix_tpv_gives_valid_false(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_NO_FIX)]
+        mock_gpsd.feed(_TPV_NO_FIX_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.valid is False
         assert data.gga.fix_quality == 0
 
     def test_utc_time_converted_from_iso8601(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_SPS)]
+        mock_gpsd.feed(_TPV_SPS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.utc_time == "123519.00"
 
     def test_utc_time_none_when_absent_from_tpv(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_NO_FIX)]
+        mock_gpsd.feed(_TPV_NO_FIX_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.utc_time is None
 
     def test_altmsl_used_for_altitude(self, mock_gpsd):
         tpv = {**_TPV_SPS, "altMSL": 100.0, "alt": 150.0}
-        mock_gpsd.stream.readline.side_effect = [_line(tpv)]
+        mock_gpsd.feed(_line(tpv))
         with GNSSReader() as gnss:
             data = gnss.read()
-        assert data.gga.altitude_meters == pytest.approx(100.0)
+        assert_close(data.gga.altitude_meters, 100.0)
 
     def test_alt_fallback_when_altmsl_absent(self, mock_gpsd):
         tpv = {k: v for k, v in _TPV_SPS.items() if k != "altMSL"}
         tpv["alt"] = 150.0
-        mock_gpsd.stream.readline.side_effect = [_line(tpv)]
+        mock_gpsd.feed(_line(tpv))
         with GNSSReader() as gnss:
             data = gnss.read()
-        assert data.gga.altitude_meters == pytest.approx(150.0)
+        assert_close(data.gga.altitude_meters, 150.0)
 
     def test_sky_fields_applied_to_subsequent_tpv(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_SKY_12), _line(_TPV_SPS)]
+        mock_gpsd.feed(_SKY_12_LINE, _TPV_SPS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.num_satellites == 12
-        assert data.gga.horizontal_dilution_of_precision == pytest.approx(0.5)
+        assert_close(data.gga.horizontal_dilution_of_precision, 0.5)
 
     def test_sky_nsat_fallback_when_usat_absent(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [
-            _line(_SKY_NSAT_ONLY),
-            _line(_TPV_SPS),
-        ]
+        mock_gpsd.feed(
+            _SKY_NSAT_ONLY_LINE,
+            _TPV_SPS_LINE,
+        )
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.num_satellites == 8
 
     def test_sky_satellites_used_flags_derived_when_usat_absent(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [
-            _line(_SKY_SATELLITES_WITH_FLAGS),
-            _line(_TPV_SPS),
-        ]
+        mock_gpsd.feed(
+            _SKY_SATELLITES_WITH_FLAGS_LINE,
+            _TPV_SPS_LINE,
+        )
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.num_satellites == 3  # 3 of 4 entries have used=True
 
     def test_sky_falls_back_to_nsat_when_no_used_flag_in_satellites(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [
-            _line(_SKY_SATELLITES_NO_USED_FLAG),
-            _line(_TPV_SPS),
-        ]
+        mock_gpsd.feed(
+            _SKY_SATELLITES_NO_USED_FLAG_LINE,
+            _TPV_SPS_LINE,
+        )
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.num_satellites == 5  # falls back to nSat
 
     def test_sky_nsat_non_int_returns_none(self, mock_gpsd):
         sky = {**_SKY_NSAT_ONLY, "nSat": "bad"}
-        mock_gpsd.stream.readline.side_effect = [_line(sky), _line(_TPV_SPS)]
+        mock_gpsd.feed(_line(sky), _TPV_SPS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.num_satellites is None
 
     def test_satellite_count_none_when_no_sky_received(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_SPS)]
+        mock_gpsd.feed(_TPV_SPS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.num_satellites is None
         assert data.gga.horizontal_dilution_of_precision is None
 
     def test_sky_state_persists_across_tpv_messages(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [
-            _line(_SKY_12),
-            _line(_TPV_SPS),
-            _line(_TPV_RTK),
-        ]
+        mock_gpsd.feed(
+            _SKY_12_LINE,
+            _TPV_SPS_LINE,
+            _TPV_RTK_LINE,
+        )
         with GNSSReader() as gnss:
             first = gnss.read()
             second = gnss.read()
@@ -361,22 +409,22 @@ class TestGNSSReaderRead:
         assert second.gga.num_satellites == 12
 
     def test_vtg_speed_and_track_from_tpv(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_SPS)]
+        mock_gpsd.feed(_TPV_SPS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.vtg is not None
-        assert data.vtg.speed_meters_per_second == pytest.approx(2.833, rel=1e-4)
-        assert data.vtg.track_true_degrees == pytest.approx(54.7, rel=1e-4)
+        assert_close(data.vtg.speed_meters_per_second, 2.833, rel=1e-4)
+        assert_close(data.vtg.track_true_degrees, 54.7, rel=1e-4)
 
     def test_vtg_valid_true_when_fix_present(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_SPS)]
+        mock_gpsd.feed(_TPV_SPS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.vtg is not None
         assert data.vtg.valid is True
 
     def test_vtg_valid_false_when_no_fix(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_NO_FIX)]
+        mock_gpsd.feed(_TPV_NO_FIX_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.vtg is not None
@@ -384,59 +432,76 @@ class TestGNSSReaderRead:
         assert data.vtg.mode == "N"
 
     def test_vtg_mode_autonomous_for_gps_fix(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_SPS)]
+        mock_gpsd.feed(_TPV_SPS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.vtg is not None
         assert data.vtg.mode == "A"
 
     def test_vtg_mode_differential_for_dgps(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_DGPS)]
+        mock_gpsd.feed(_TPV_DGPS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.vtg is not None
         assert data.vtg.mode == "D"
 
     def test_vtg_mode_differential_for_rtk_fixed(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_RTK)]
+        mock_gpsd.feed(_TPV_RTK_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.vtg is not None
         assert data.vtg.mode == "D"
 
     def test_non_tpv_non_sky_messages_are_skipped(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [
-            _line(_WATCH_MSG),
-            _line(_VERSION_MSG),
-            _line(_TPV_SPS),
-        ]
+        mock_gpsd.feed(
+            _WATCH_MSG_LINE,
+            _VERSION_MSG_LINE,
+            _TPV_SPS_LINE,
+        )
         with GNSSReader() as gnss:
             data = gnss.read()
         assert isinstance(data, GNSSData)
         assert data.gga.fix_quality == 1
 
     def test_invalid_json_lines_are_skipped(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [
-            _GARBAGE.encode(),
-            _line(_TPV_SPS),
-        ]
+        mock_gpsd.feed(_GARBAGE, _TPV_SPS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert isinstance(data, GNSSData)
 
+    def test_invalid_utf8_bytes_are_ignored(self, mock_gpsd):
+        line = _line({**_TPV_SPS, "device": "/dev/ttyACM0"})
+        mock_gpsd.feed(line.replace(b"ACM0", b"ACM\xff0"))
+        with GNSSReader() as gnss:
+            data = gnss.read()
+        assert data.gga.fix_quality == 1
+        assert data.gga.latitude_degrees == _TPV_SPS["lat"]
+
+    def test_unparseable_lines_after_decoding_are_skipped(self, mock_gpsd):
+        mock_gpsd.feed(b'{"class": "TPV", \xff\n', _TPV_SPS_LINE)
+        with GNSSReader() as gnss:
+            data = gnss.read()
+        assert data.gga.fix_quality == 1
+
     def test_non_dict_json_lines_are_skipped(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [
-            b"[1, 2, 3]\n",
-            _line(_TPV_SPS),
-        ]
+        mock_gpsd.feed(b"[1, 2, 3]\n", _TPV_SPS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert isinstance(data, GNSSData)
 
+    def test_non_string_class_lines_are_skipped(self, mock_gpsd):
+        mock_gpsd.feed(
+            b'{"class": ["TPV"], "status": 1}\n',
+            _TPV_NO_FIX_LINE,
+        )
+        with GNSSReader() as gnss:
+            data = gnss.read()
+        assert data.gga.fix_quality == 0
+
     def test_timeout_retried_until_tpv_arrives(self, mock_gpsd):
         mock_gpsd.stream.readline.side_effect = [
             TimeoutError(),
-            _line(_TPV_SPS),
+            _TPV_SPS_LINE,
         ]
         with GNSSReader() as gnss:
             data = gnss.read()
@@ -448,7 +513,7 @@ class TestGNSSReaderRead:
             gnss.read()
 
     def test_empty_readline_raises_eof_error(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [b""]
+        mock_gpsd.feed(b"")
         with GNSSReader() as gnss, pytest.raises(EOFError):
             gnss.read()
 
@@ -489,7 +554,7 @@ class TestGNSSReaderCancel:
 
 class TestGNSSReaderCleanup:
     def test_closes_stream_and_socket_on_normal_exit(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_SPS)]
+        mock_gpsd.feed(_TPV_SPS_LINE)
         with GNSSReader() as gnss:
             gnss.read()
         mock_gpsd.stream.close.assert_called_once()
@@ -509,21 +574,18 @@ class TestGNSSReaderCleanup:
 
 class TestGNSSReaderIter:
     def test_yields_gnss_data_instances(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [
-            _line(_TPV_SPS),
-            _line(_TPV_RTK),
-            _line(_TPV_NO_FIX),
-        ]
+        mock_gpsd.feed(
+            _TPV_SPS_LINE,
+            _TPV_RTK_LINE,
+            _TPV_NO_FIX_LINE,
+        )
         with GNSSReader() as gnss:
             samples = list(itertools.islice(gnss, 3))
         assert len(samples) == 3
         assert all(isinstance(s, GNSSData) for s in samples)
 
     def test_iter_includes_vtg_from_first_tpv(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [
-            _line(_TPV_SPS),
-            _line(_TPV_RTK),
-        ]
+        mock_gpsd.feed(_TPV_SPS_LINE, _TPV_RTK_LINE)
         with GNSSReader() as gnss:
             samples = list(itertools.islice(gnss, 2))
         assert samples[0].vtg is not None
@@ -539,69 +601,69 @@ class TestGNSSReaderIter:
 
 class TestGNSSReaderStatusFallback:
     def test_mode3_no_status_fix_quality_is_gps(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_MODE3_NO_STATUS)]
+        mock_gpsd.feed(_TPV_MODE3_NO_STATUS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.fix_quality == 1
 
     def test_mode3_no_status_gga_valid_true(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_MODE3_NO_STATUS)]
+        mock_gpsd.feed(_TPV_MODE3_NO_STATUS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.valid is True
 
     def test_mode3_no_status_position_fields_populated(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_MODE3_NO_STATUS)]
+        mock_gpsd.feed(_TPV_MODE3_NO_STATUS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
-        assert data.gga.latitude_degrees == pytest.approx(35.6586, rel=1e-6)
-        assert data.gga.longitude_degrees == pytest.approx(139.7454, rel=1e-6)
-        assert data.gga.altitude_meters == pytest.approx(10.0, rel=1e-4)
+        assert_close(data.gga.latitude_degrees, 35.6586, rel=1e-6)
+        assert_close(data.gga.longitude_degrees, 139.7454, rel=1e-6)
+        assert_close(data.gga.altitude_meters, 10.0, rel=1e-4)
 
     def test_mode3_no_status_vtg_valid_true(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_MODE3_NO_STATUS)]
+        mock_gpsd.feed(_TPV_MODE3_NO_STATUS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.vtg is not None
         assert data.vtg.valid is True
 
     def test_mode3_no_status_vtg_mode_autonomous(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_MODE3_NO_STATUS)]
+        mock_gpsd.feed(_TPV_MODE3_NO_STATUS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.vtg is not None
         assert data.vtg.mode == "A"
 
     def test_mode2_no_status_fix_quality_is_gps(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_MODE2_NO_STATUS)]
+        mock_gpsd.feed(_TPV_MODE2_NO_STATUS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.fix_quality == 1
         assert data.gga.valid is True
 
     def test_mode1_no_status_fix_quality_is_invalid(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_MODE1_NO_STATUS)]
+        mock_gpsd.feed(_TPV_MODE1_NO_STATUS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.fix_quality == 0
         assert data.gga.valid is False
 
     def test_mode0_no_status_fix_quality_is_invalid(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_MODE0_NO_STATUS)]
+        mock_gpsd.feed(_TPV_MODE0_NO_STATUS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.fix_quality == 0
         assert data.gga.valid is False
 
     def test_no_status_no_mode_fix_quality_is_invalid(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_NO_STATUS_NO_MODE)]
+        mock_gpsd.feed(_TPV_NO_STATUS_NO_MODE_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.fix_quality == 0
         assert data.gga.valid is False
 
     def test_mode1_no_status_vtg_valid_false(self, mock_gpsd):
-        mock_gpsd.stream.readline.side_effect = [_line(_TPV_MODE1_NO_STATUS)]
+        mock_gpsd.feed(_TPV_MODE1_NO_STATUS_LINE)
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.vtg is not None
@@ -610,7 +672,7 @@ class TestGNSSReaderStatusFallback:
 
     def test_status_field_takes_precedence_over_mode(self, mock_gpsd):
         tpv = {**_TPV_MODE3_NO_STATUS, "status": 0}
-        mock_gpsd.stream.readline.side_effect = [_line(tpv)]
+        mock_gpsd.feed(_line(tpv))
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.fix_quality == 0
@@ -618,7 +680,7 @@ class TestGNSSReaderStatusFallback:
 
     def test_null_mode_no_status_fix_quality_is_invalid(self, mock_gpsd):
         tpv = {"class": "TPV", "mode": None}
-        mock_gpsd.stream.readline.side_effect = [_line(tpv)]
+        mock_gpsd.feed(_line(tpv))
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.fix_quality == 0
@@ -626,7 +688,7 @@ class TestGNSSReaderStatusFallback:
 
     def test_null_status_fix_quality_is_invalid(self, mock_gpsd):
         tpv = {"class": "TPV", "status": None, "mode": 3}
-        mock_gpsd.stream.readline.side_effect = [_line(tpv)]
+        mock_gpsd.feed(_line(tpv))
         with GNSSReader() as gnss:
             data = gnss.read()
         assert data.gga.fix_quality == 0
@@ -0,0 +1,44 @@
+"""Assertion helpers and data factories shared across the test packages."""
+
+import math
+
+from sensing.nmea.types import GGAData, VTGData
+
+
+def assert_close(
+    actual: float | None,
+    expected: float,
+    *,
+    rel: float = 1e-6,
+    atol: float = 1e-12,
+) -> None:
+    """Assert a parsed float is present and within pytest.approx's default tolerances."""
+    assert actual is not None
+    assert math.isclose(actual, expected, rel_tol=rel, abs_tol=atol)
+
+
+def make_gga() -> GGAData:
+    """Build a plain GGAData value to stand in for a parsed fix."""
+    return GGAData(
+        utc_time="123519.00",
+        latitude_degrees=48.1173,
+        longitude_degrees=11.5167,
+        fix_quality=1,
+        num_satellites=8,
+        horizontal_dilution_of_precision=0.9,
+        altitude_meters=545.4,
+        geoid_height_meters=47.0,
+        valid=True,
+    )
+
+
+def make_vtg(*, valid: bool = True) -> VTGData:
+    """Build a plain VTGData value to stand in for a parsed velocity."""
+    return VTGData(
+        track_true_degrees=54.7,
+        speed_knots=5.5,
+        speed_kilometers_per_hour=10.2,
+        speed_meters_per_second=2.833,
+        mode="A" if valid else "N",
+        valid=valid,
+    )
@@ -26,11 +26,14 @@ from sensing.imu.reader import (
     _reset_imu,
     _start_imu,
 )
+from tests.helpers import assert_close
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+_RAW_STRUCT = struct.Struct("<hhhhhh")
+
 
 def _make_raw(
     gx: int = 0,
@@ -41,7 +44,7 @@ def _make_raw(
     az: int = 0,
 ) -> bytes:
     """Pack six signed 16-bit integers into 12 raw output-register bytes."""
-    return struct.pack("<hhhhhh", gx, gy, gz, ax, ay, az)
+    return _RAW_STRUCT.pack(gx, gy, gz, ax, ay, az)
 
 
 # ---------------------------------------------------------------------------
@@ -49,12 +52,30 @@ def _make_raw(
 # ---------------------------------------------------------------------------
 
 
+@pytest.fixture(scope="module")
+def hw_classes():
+    """Patch the hardware classes once for the whole module.
+
+    Patches spidev.SpiDev, gpiod.Chip, and time.sleep a single time instead
+    of once per test. The class mocks are rewired to fresh instance mocks by
+    ``mock_hw`` before every test, so no state leaks between tests.
+    """
+    spi_cls = MagicMock()
+    chip_cls = MagicMock()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(spidev, "SpiDev", spi_cls)
+        mp.setattr(gpiod, "Chip", chip_cls)
+        mp.setattr(time, "sleep", MagicMock())
+        yield SimpleNamespace(spi_cls=spi_cls, chip_cls=chip_cls)
+
+
 @pytest.fixture
-def mock_hw(monkeypatch):
-    """Replace all hardware objects with mocks for the duration of a test.
+def mock_hw(hw_classes):
+    """Provide fresh hardware mocks for the duration of a test.
 
-    Patches spidev.SpiDev, gpiod.Chip, and time.sleep so that IMUReader can
-    be instantiated and exercised without hardware.
+    Builds new SpiDev, Chip, and LineRequest mocks and installs them as the
+    return values of the module-wide class patches from ``hw_classes``, so
+    that IMUReader can be instantiated and exercised without hardware.
 
     Returns a SimpleNamespace with attributes:
         spi       -- the SpiDev instance mock
@@ -76,16 +97,15 @@ def mock_hw(monkeypatch):
     mock_chip = MagicMock()
     mock_chip.request_lines.return_value = mock_request
 
-    mock_chip_cls = MagicMock(return_value=mock_chip)
-
-    monkeypatch.setattr(spidev, "SpiDev", MagicMock(return_value=mock_spi))
-    monkeypatch.setattr(gpiod, "Chip", mock_chip_cls)
-    monkeypatch.setattr(time, "sleep", MagicMock())
+    hw_classes.spi_cls.reset_mock(return_value=True, side_effect=True)
+    hw_classes.spi_cls.return_value = mock_spi
+    hw_classes.chip_cls.reset_mock(return_value=True, side_effect=True)
+    hw_classes.chip_cls.return_value = mock_chip
 
     return SimpleNamespace(
         spi=mock_spi,
         chip=mock_chip,
-        chip_cls=mock_chip_cls,
+        chip_cls=hw_classes.chip_cls,
         request=mock_request,
         event=mock_event,
     )
@@ -101,68 +121,68 @@ class TestParseSample:
 
     def test_all_zeros_produce_zero_output(self):
         sample = _parse_sample(_make_raw(), timestamp_ns=0)
-        assert sample.accel_x == pytest.approx(0.0)
-        assert sample.accel_y == pytest.approx(0.0)
-        assert sample.accel_z == pytest.approx(0.0)
-        assert sample.gyro_x == pytest.approx(0.0)
-        assert sample.gyro_y == pytest.approx(0.0)
-        assert sample.gyro_z == pytest.approx(0.0)
+        assert_close(sample.accel_x, 0.0)
+        assert_close(sample.accel_y, 0.0)
+        assert_close(sample.accel_z, 0.0)
+        assert_close(sample.gyro_x, 0.0)
+        assert_close(sample.gyro_y, 0.0)
+        assert_close(sample.gyro_z, 0.0)
 
     def test_one_lsb_accel_x(self):
         sample = _parse_sample(_make_raw(ax=1), timestamp_ns=0)
-        assert sample.accel_x == pytest.approx(_ACCEL_SENSITIVITY)
-        assert sample.accel_y == pytest.approx(0.0)
-        assert sample.accel_z == pytest.approx(0.0)
+        assert_close(sample.accel_x, _ACCEL_SENSITIVITY)
+        assert_close(sample.accel_y, 0.0)
+        assert_close(sample.accel_z, 0.0)
 
     def test_one_lsb_accel_y(self):
         sample = _parse_sample(_make_raw(ay=1), timestamp_ns=0)
-        assert sample.accel_x == pytest.approx(0.0)
-        assert sample.accel_y == pytest.approx(_ACCEL_SENSITIVITY)
-        assert sample.accel_z == pytest.approx(0.0)
+        assert_close(sample.accel_x, 0.0)
+        assert_close(sample.accel_y, _ACCEL_SENSITIVITY)
+        assert_close(sample.accel_z, 0.0)
 
     def test_one_lsb_accel_z(self):
         sample = _parse_sample(_make_raw(az=1), timestamp_ns=0)
-        assert sample.accel_x == pytest.approx(0.0)
-        assert sample.accel_z == pytest.approx(_ACCEL_SENSITIVITY)
+        assert_close(sample.accel_x, 0.0)
+        assert_close(sample.accel_z, _ACCEL_SENSITIVITY)
 
     def test_one_lsb_gyro_x(self):
         sample = _parse_sample(_make_raw(gx=1), timestamp_ns=0)
-        assert sample.gyro_x == pytest.approx(_GYRO_SENSITIVITY)
-        assert sample.gyro_y == pytest.approx(0.0)
-        assert sample.gyro_z == pytest.approx(0.0)
+        assert_close(sample.gyro_x, _GYRO_SENSITIVITY)
+        assert_close(sample.gyro_y, 0.0)
+        assert_close(sample.gyro_z, 0.0)
 
     def test_one_lsb_gyro_y(self):
         sample = _parse_sample(_make_raw(gy=1), timestamp_ns=0)
-        assert sample.gyro_x == pytest.approx(0.0)
-        assert sample.gyro_y == pytest.approx(_GYRO_SENSITIVITY)
-        assert sample.gyro_z == pytest.approx(0.0)
+        assert_close(sample.gyro_x, 0.0)
+        assert_close(sample.gyro_y, _GYRO_SENSITIVITY)
+        assert_close(sample.gyro_z, 0.0)
 
     def test_one_lsb_gyro_z(self):
         sample = _parse_sample(_make_raw(gz=1), timestamp_ns=0)
-        assert sample.gyro_z == pytest.approx(_GYRO_SENSITIVITY)
+        assert_close(sample.gyro_z, _GYRO_SENSITIVITY)
 
     def test_negative_accel(self):
         sample = _parse_sample(_make_raw(ax=-1), timestamp_ns=0)
-        assert sample.accel_x == pytest.approx(-_ACCEL_SENSITIVITY)
+        assert_close(sample.accel_x, -_ACCEL_SENSITIVITY)
 
     def test_negative_gyro(self):
         sample = _parse_sample(_make_raw(gx=-1), timestamp_ns=0)
-        assert sample.gyro_x == pytest.approx(-_GYRO_SENSITIVITY)
+        assert_close(sample.gyro_x, -_GYRO_SENSITIVITY)
 
     def test_max_int16(self):
         sample = _parse_sample(_make_raw(ax=32767, gx=32767), timestamp_ns=0)
-        assert sample.accel_x == pytest.approx(32767 * _ACCEL_SENSITIVITY)
-        assert sample.gyro_x == pytest.approx(32767 * _GYRO_SENSITIVITY)
+        assert_close(sample.accel_x, 32767 * _ACCEL_SENSITIVITY)
+        assert_close(sample.gyro_x, 32767 * _GYRO_SENSITIVITY)
 
     def test_min_int16(self):
         sample = _parse_sample(_make_raw(ax=-32768, gx=-32768), timestamp_ns=0)
-        assert sample.accel_x == pytest.approx(-32768 * _ACCEL_SENSITIVITY)
-        assert sample.gyro_x == pytest.approx(-32768 * _GYRO_SENSITIVITY)
+        assert_close(sample.accel_x, -32768 * _ACCEL_SENSITIVITY)
+        assert_close(sample.gyro_x, -32768 * _GYRO_SENSITIVITY)
 
     def test_approx_one_g_on_z_axis(self):
         # 16384 LSB * 0.061 mg/LSB ≈ 999 mg; rel=1e-2 allows for LSB rounding
         sample = _parse_sample(_make_raw(az=16384), timestamp_ns=0)
-        assert sample.accel_z == pytest.approx(9.80665, rel=1e-2)
+        assert_close(sample.accel_z, 9.80665, rel=1e-2)
 
     def test_full_scale_gyro_is_2293_dps_not_2000(self):
         # The FS=±2000 dps label is not the true full-scale range.
@@ -170,7 +190,7 @@ class TestParseSample:
         # gives 32767 * 70e-3 = 2293.69 dps, not 2000 dps.
         sample = _parse_sample(_make_raw(gz=32767), timestamp_ns=0)
         expected_rad_s = 2293.69 * (math.pi / 180.0)
-        assert sample.gyro_z == pytest.approx(expected_rad_s, rel=1e-3)
+        assert_close(sample.gyro_z, expected_rad_s, rel=1e-3)
 
     def test_timestamp_is_preserved(self):
         ts = 1_700_000_000_123_456_789
@@ -179,17 +199,22 @@ class TestParseSample:
 
     def test_all_six_axes_are_independent(self):
         sample = _parse_sample(_make_raw(gx=1, gy=2, gz=3, ax=4, ay=5, az=6), timestamp_ns=0)
-        assert sample.gyro_x == pytest.approx(1 * _GYRO_SENSITIVITY)
-        assert sample.gyro_y == pytest.approx(2 * _GYRO_SENSITIVITY)
-        assert sample.gyro_z == pytest.approx(3 * _GYRO_SENSITIVITY)
-        assert sample.accel_x == pytest.approx(4 * _ACCEL_SENSITIVITY)
-        assert sample.accel_y == pytest.approx(5 * _ACCEL_SENSITIVITY)
-        assert sample.accel_z == pytest.approx(6 * _ACCEL_SENSITIVITY)
+        assert_close(sample.gyro_x, 1 * _GYRO_SENSITIVITY)
+        assert_close(sample.gyro_y, 2 * _GYRO_SENSITIVITY)
+        assert_close(sample.gyro_z, 3 * _GYRO_SENSITIVITY)
+        assert_close(sample.accel_x, 4 * _ACCEL_SENSITIVITY)
+        assert_close(sample.accel_y, 5 * _ACCEL_SENSITIVITY)
+        assert_close(sample.accel_z, 6 * _ACCEL_SENSITIVITY)
 
     def test_returns_imu_data_instance(self):
         sample = _parse_sample(_make_raw(), timestamp_ns=0)
         assert isinstance(sample, IMUData)
 
+    def test_vector_properties_group_axes_in_xyz_order(self):
+        sample = _parse_sample(_make_raw(gx=1, gy=2, gz=3, ax=4, ay=5, az=6), timestamp_ns=0)
+        assert sample.accel == (sample.accel_x, sample.accel_y, sample.accel_z)
+        assert sample.gyro == (sample.gyro_x, sample.gyro_y, sample.gyro_z)
+
 
 # ---------------------------------------------------------------------------
 # _reset_imu
@@ -262,22 +287,31 @@ class TestReadSample:
         spi = MagicMock()
         spi.xfer2.return_value = [0] * 13
         _read_sample(spi, timestamp_ns=0)
-        cmd = spi.xfer2.call_args[0][0]
+        (cmd,), _ = spi.xfer2.call_args
         assert cmd[0] == _REG_OUTX_L_G | 0x80
 
     def test_sends_thirteen_byte_message(self):
         spi = MagicMock()
         spi.xfer2.return_value = [0] * 13
         _read_sample(spi, timestamp_ns=0)
-        assert len(spi.xfer2.call_args[0][0]) == 13
+        (cmd,), _ = spi.xfer2.call_args
+        assert len(cmd) == 13
+
+    def test_reuses_one_command_buffer_across_reads(self):
+        spi = MagicMock()
+        spi.xfer2.return_value = [0] * 13
+        _read_sample(spi, timestamp_ns=0)
+        _read_sample(spi, timestamp_ns=1)
+        first, second = spi.xfer2.call_args_list
+        assert first.args[0] is second.args[0]
 
     def test_parses_spi_response_into_imu_data(self):
         spi = MagicMock()
         raw = _make_raw(gx=10, ax=20)
         spi.xfer2.return_value = [0, *list(raw)]
         sample = _read_sample(spi, timestamp_ns=0)
-        assert sample.gyro_x == pytest.approx(10 * _GYRO_SENSITIVITY)
-        assert sample.accel_x == pytest.approx(20 * _ACCEL_SENSITIVITY)
+        assert_close(sample.gyro_x, 10 * _GYRO_SENSITIVITY)
+        assert_close(sample.accel_x, 20 * _ACCEL_SENSITIVITY)
 
 
 # ---------------------------------------------------------------------------
@@ -311,16 +345,16 @@ class TestIMUReaderSetup:
 
     def test_requests_gpio_line_with_rising_edge(self, mock_hw):
         with IMUReader(gpio_line=25):
-            config = mock_hw.chip.request_lines.call_args.kwargs["config"]
-            settings = config[25]
+            _, kwargs = mock_hw.chip.request_lines.call_args
+            settings = kwargs["config"][25]
             assert settings.direction == Direction.INPUT
             assert settings.edge_detection == Edge.RISING
             assert settings.event_clock == Clock.REALTIME
 
     def test_requests_gpio_with_consumer_name(self, mock_hw):
         with IMUReader():
-            consumer = mock_hw.chip.request_lines.call_args.kwargs["consumer"]
-            assert consumer == "IMUReader"
+            _, kwargs = mock_hw.chip.request_lines.call_args
+            assert kwargs["consumer"] == "IMUReader"
 
     def test_reset_is_called_before_gpio_setup(self, mock_hw):
         # _reset_imu writes to SPI; GPIO request_lines must happen after.
@@ -1,6 +1,9 @@
 """Tests for NMEA checksum validation."""
 
+import pytest
+
 from sensing import validate_checksum
+from sensing.nmea.checksum import extract_validated_content
 
 GGA_VALID = "$GNGGA,123519.00,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*7F"
 VTG_VALID = "$GNVTG,054.7,T,034.4,M,005.5,N,010.2,K,A*3B"
@@ -32,5 +35,61 @@ class TestValidateChecksum:
     def test_truncated_checksum(self):
         assert validate_checksum(GGA_VALID[:-1]) is False
 
+    def test_trailing_data_after_checksum(self):
+        assert validate_checksum(GGA_VALID + ",X") is False
+
+    def test_asterisk_inside_payload(self):
+        # The checksum is correct for the content, but '*' must only delimit it
+        assert validate_checksum("$GNVTG,054.7,*,034.4,M,005.5,N,010.2,K,A*45") is False
+
+    def test_lowercase_hex_checksum(self):
+        assert validate_checksum(GGA_VALID[:-2] + GGA_VALID[-2:].lower()) is True
+
     def test_valid_vtg_checksum(self):
         assert validate_checksum(VTG_VALID) is True
+
+    def test_non_ascii_content(self):
+        sentence = GGA_VALID.replace("N", "Ñ", 1)
+        assert validate_checksum(sentence) is False
+
+    def test_valid_bytes_sentence(self):
+        assert validate_checksum(GGA_VALID.encode()) is True
+
+    def test_non_ascii_bytes(self):
+        sentence = GGA_VALID.replace("N", "Ñ", 1).encode()
+        assert validate_checksum(sentence) is False
+
+
+class TestExtractValidatedContent:
+    """Tests for extract_validated_content function."""
+
+    def test_returns_content_between_delimiters(self):
+        assert extract_validated_content(VTG_VALID) == "GNVTG,054.7,T,034.4,M,005.5,N,010.2,K,A"
+
+    def test_strips_line_ending(self):
+        assert extract_validated_content(VTG_VALID + "\r\n") == VTG_VALID[1:-3]
+
+    def test_invalid_checksum_returns_none(self):
+        assert extract_validated_content(VTG_VALID[:-2] + "FF") is None
+
+    def test_missing_asterisk_returns_none(self):
+        assert extract_validated_content(VTG_VALID.replace("*", "")) is None
+
+    def test_bytes_input_returns_text_content(self):
+        assert extract_validated_content(VTG_VALID.encode() + b"\r\n") == VTG_VALID[1:-3]
+
+    def test_non_ascii_after_checksum_returns_none(self):
+        assert extract_validated_content(VTG_VALID + "Ñ") is None
+
+    def test_skip_checksum_mode_accepts_bad_checksum(self):
+        assert (
+            extract_validated_content(VTG_VALID[:-2] + "FF", verify_checksum=False)
+            == VTG_VALID[1:-3]
+        )
+
+    def test_skip_checksum_mode_still_requires_hex_checksum(self):
+        assert extract_validated_content(VTG_VALID[:-2] + "ZZ", verify_checksum=False) is None
+
+    @pytest.mark.parametrize("checksum", [" 7", "+7", "-7", "0x"])
+    def test_skip_checksum_mode_rejects_int_literal_forms(self, checksum):
+        assert extract_validated_content(VTG_VALID[:-2] + checksum, verify_checksum=False) is None
@@ -1,40 +1,60 @@
 """Tests for GGA sentence parsing."""
 
+import functools
+import math
+import operator
+
 import pytest
 
-from sensing import parse_gga
+from sensing import GGAData, parse_gga, parse_gga_batch
+from tests.helpers import assert_close
+
+_GGA_WITH_FIX = "$GNGGA,123519.00,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*7F"
+
+
+@pytest.fixture
+def gga_with_fix():
+    """Parse the canonical GPS-fix sentence afresh for each test that reads it."""
+    result = parse_gga(_GGA_WITH_FIX)
+    assert result is not None
+    return result
 
 
 class TestParseGGA:
     """Tests for parse_gga function."""
 
-    def test_valid_gga_with_fix(self):
-        sentence = "$GNGGA,123519.00,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*7F"
-        result = parse_gga(sentence)
-        assert result is not None
-        assert result.utc_time == "123519.00"
-        assert result.latitude_degrees == pytest.approx(48.1173, rel=1e-4)
-        assert result.longitude_degrees == pytest.approx(11.5166667, rel=1e-4)
-        assert result.fix_quality == 1
-        assert result.num_satellites == 8
-        assert result.horizontal_dilution_of_precision == pytest.approx(0.9)
-        assert result.altitude_meters == pytest.approx(545.4)
-        assert result.geoid_height_meters == pytest.approx(47.0)
-        assert result.valid is True
+    def test_valid_gga_with_fix(self, gga_with_fix):
+        # Coordinates are written as the parser's own degrees + minutes / 60
+        # arithmetic, so the whole record compares exactly in one assert.
+        assert gga_with_fix == GGAData(
+            utc_time="123519.00",
+            latitude_degrees=48 + 7.038 / 60.0,
+            longitude_degrees=11 + 31.000 / 60.0,
+            fix_quality=1,
+            num_satellites=8,
+            horizontal_dilution_of_precision=0.9,
+            altitude_meters=545.4,
+            geoid_height_meters=47.0,
+            valid=True,
+        )
+
+    def test_valid_gga_with_fix_position(self, gga_with_fix):
+        assert_close(gga_with_fix.latitude_degrees, 48.1173, rel=1e-4)
+        assert_close(gga_with_fix.longitude_degrees, 11.5166667, rel=1e-4)
 
     def test_gga_no_fix(self):
         sentence = "$GNGGA,123519.00,,,,,0,00,,,,,,,*5B"
-        result = parse_gga(sentence)
-        assert result is not None
-        assert result.utc_time == "123519.00"
-        assert result.latitude_degrees is None
-        assert result.longitude_degrees is None
-        assert result.fix_quality == 0
-        assert result.num_satellites == 0
-        assert result.horizontal_dilution_of_precision is None
-        assert result.altitude_meters is None
-        assert result.geoid_height_meters is None
-        assert result.valid is False
+        assert parse_gga(sentence) == GGAData(
+            utc_time="123519.00",
+            latitude_degrees=None,
+            longitude_degrees=None,
+            fix_quality=0,
+            num_satellites=0,
+            horizontal_dilution_of_precision=None,
+            altitude_meters=None,
+            geoid_height_meters=None,
+            valid=False,
+        )
 
     def test_gga_empty_fields_with_fix(self):
         sentence = "$GNGGA,123519.00,4807.038,N,01131.000,E,1,,,545.4,M,,M,,*4D"
@@ -43,14 +63,14 @@ class TestParseGGA:
         assert result.fix_quality == 1
         assert result.num_satellites is None
         assert result.horizontal_dilution_of_precision is None
-        assert result.altitude_meters == pytest.approx(545.4)
+        assert result.altitude_meters == 545.4
 
     def test_gga_southern_hemisphere(self):
         sentence = "$GPGGA,123519.00,3356.123,S,15112.456,W,2,10,0.8,100.0,M,20.0,M,,*65"
         result = parse_gga(sentence)
         assert result is not None
-        assert result.latitude_degrees == pytest.approx(-33.93538333, rel=1e-4)
-        assert result.longitude_degrees == pytest.approx(-151.20760, rel=1e-4)
+        assert_close(result.latitude_degrees, -33.93538333, rel=1e-4)
+        assert_close(result.longitude_degrees, -151.20760, rel=1e-4)
 
     def test_gga_rtk_fixed(self):
         sentence = "$GNGGA,123519.00,4807.038,N,01131.000,E,4,12,0.5,545.4,M,47.0,M,,*7D"
@@ -61,8 +81,11 @@ class TestParseGGA:
         assert parse_gga(sentence) is not None
 
     def test_gga_invalid_checksum(self):
-        sentence = "$GNGGA,123519.00,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*FF"
-        assert parse_gga(sentence) is None
+        assert parse_gga(_GGA_WITH_FIX[:-2] + "FF") is None
+
+    def test_gga_invalid_checksum_accepted_when_verification_skipped(self):
+        result = parse_gga(_GGA_WITH_FIX[:-2] + "FF", verify_checksum=False)
+        assert result is not None and result.fix_quality == 1
 
     def test_gga_malformed_too_few_fields(self):
         assert parse_gga("$GNGGA,123519.00,4807.038,N*12") is None
@@ -78,24 +101,86 @@ class TestParseGGA:
         result = parse_gga("$GNGGA,123519.00,,,,,,,,,,,,,*6B")
         assert result is not None and result.fix_quality == 0
 
-    def test_gga_multi_constellation_prefixes(self):
-        prefixes = [("GP", "61"), ("GN", "7F"), ("GL", "7D"),
-                    ("GA", "70"), ("GB", "73"), ("GQ", "60")]
-        for prefix, checksum in prefixes:
-            sentence = f"${prefix}GGA,123519.00,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*{checksum}"
-            assert parse_gga(sentence) is not None, f"Failed: {prefix}"
+    @pytest.mark.parametrize(
+        ("prefix", "checksum"),
+        [("GP", "61"), ("GN", "7F"), ("GL", "7D"), ("GA", "70"), ("GB", "73"), ("GQ", "60")],
+    )
+    def test_gga_multi_constellation_prefixes(self, prefix, checksum):
+        sentence = f"${prefix}GGA,123519.00,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*{checksum}"
+        assert parse_gga(sentence) is not None
 
     def test_gga_trailing_whitespace(self):
-        sentence = "$GNGGA,123519.00,4807.038,N,01131.000,E,1,08,0.9,545.4,M,47.0,M,,*7F   \n"
-        assert parse_gga(sentence) is not None
+        assert parse_gga(_GGA_WITH_FIX + "   \n") is not None
 
     def test_gga_high_precision_coordinates(self):
         sentence = "$GNGGA,123519.00,4807.03812345,N,01131.00098765,E,4,12,0.5,545.4,M,47.0,M,,*79"
         result = parse_gga(sentence)
         assert result is not None
-        assert result.latitude_degrees == pytest.approx(48.11730208, rel=1e-6)
-        assert result.longitude_degrees == pytest.approx(11.51668313, rel=1e-6)
+        assert_close(result.latitude_degrees, 48.11730208, rel=1e-6)
+        assert_close(result.longitude_degrees, 11.51668313, rel=1e-6)
 
     def test_zedf9p_gga_rtk_fixed(self):
         sentence = "$GNGGA,081836.00,3723.46587,N,12202.26957,W,4,12,0.7,10.5,M,-30.0,M,1.0,0000*51"
-        assert parse_gga(sentence) is not None
\ No newline at end of file
+        assert parse_gga(sentence) is not None
+
+
+class TestParseGGABatch:
+    """Tests for parse_gga_batch function."""
+
+    _SENTENCES = (
+        _GGA_WITH_FIX,
+        "$GPGGA,123519.00,3356.123,S,15112.456,W,2,10,0.8,100.0,M,20.0,M,,*65",
+        "$GNGGA,081836.00,3723.46587,N,12202.26957,W,4,12,0.7,10.5,M,-30.0,M,1.0,0000*51",
+    )
+
+    def test_parse_gga_batch_equivalence(self):
+        batch = parse_gga_batch(self._SENTENCES)
+        assert len(batch) == len(self._SENTENCES)
+        for i, sentence in enumerate(self._SENTENCES):
+            expected = parse_gga(sentence)
+            assert expected is not None
+            assert batch.source_index[i] == i
+            assert batch.utc_time[i] == expected.utc_time
+            assert batch.latitude_degrees[i] == expected.latitude_degrees
+            assert batch.longitude_degrees[i] == expected.longitude_degrees
+            assert batch.fix_quality[i] == expected.fix_quality
+            assert batch.num_satellites[i] == expected.num_satellites
+            assert (
+                batch.horizontal_dilution_of_precision[i]
+                == expected.horizontal_dilution_of_precision
+            )
+            assert batch.altitude_meters[i] == expected.altitude_meters
+            assert batch.geoid_height_meters[i] == expected.geoid_height_meters
+            assert batch.valid[i] == expected.valid
+
+    def test_rejected_sentences_are_skipped_with_source_index(self):
+        batch = parse_gga_batch([_GGA_WITH_FIX[:-2] + "FF", _GGA_WITH_FIX, "garbage"])
+        assert len(batch) == 1
+        assert batch.source_index.tolist() == [1]
+        assert batch.fix_quality.tolist() == [1]
+
+    def test_missing_fields_become_nan_and_minus_one(self):
+        batch = parse_gga_batch(["$GNGGA,123519.00,,,,,,,,,,,,,*6B"])
+        assert math.isnan(batch.latitude_degrees[0])
+        assert math.isnan(batch.altitude_meters[0])
+        assert math.isnan(batch.geoid_height_meters[0])
+        assert batch.num_satellites[0] == -1
+        assert batch.valid[0] == 0
+
+    @pytest.mark.parametrize(
+        ("fix_quality", "num_satellites"),
+        [("1" + "0" * 400, "08"), ("1", "-1"), ("40000", "08"), ("1", "40000")],
+    )
+    def test_out_of_range_counts_are_skipped(self, fix_quality, num_satellites):
+        body = f"GNGGA,123519.00,4807.038,N,01131.000,E,{fix_quality},{num_satellites},0.9,545.4,M,47.0,M,,"
+        sentence = f"${body}*{functools.reduce(operator.xor, body.encode(), 0):02X}"
+        assert parse_gga(sentence) is not None
+        batch = parse_gga_batch([sentence, _GGA_WITH_FIX])
+        assert batch.source_index.tolist() == [1]
+
+    def test_accepts_bytes(self):
+        batch = parse_gga_batch([_GGA_WITH_FIX.encode("ascii")])
+        assert batch.fix_quality.tolist() == [1]
+
+    def test_empty_input_gives_empty_batch(self):
+        assert len(parse_gga_batch([])) == 0
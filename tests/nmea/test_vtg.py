@@ -3,6 +3,14 @@
 import pytest
 
 from sensing import parse_vtg
+from tests.helpers import assert_close
+
+# Shared fields of the moving-receiver sentences, between the talker/type and
+# the FAA mode indicator
+_VTG_BODY = "054.7,T,034.4,M,005.5,N,010.2,K"
+
+# Encoded once at import, as a serial or socket reader would hand it over
+_VTG_AUTONOMOUS_BYTES = f"$GNVTG,{_VTG_BODY},A*3B\r\n".encode("ascii")
 
 
 class TestParseVTG:
@@ -12,28 +20,34 @@ class TestParseVTG:
         sentence = "$GNVTG,054.7,T,034.4,M,005.5,N,010.2,K,A*3B"
         result = parse_vtg(sentence)
         assert result is not None
-        assert result.track_true_degrees == pytest.approx(54.7)
-        assert result.speed_knots == pytest.approx(5.5)
-        assert result.speed_kilometers_per_hour == pytest.approx(10.2)
-        assert result.speed_meters_per_second == pytest.approx(10.2 / 3.6)
+        assert result.track_true_degrees == 54.7
+        assert result.speed_knots == 5.5
+        assert result.speed_kilometers_per_hour == 10.2
+        assert_close(result.speed_meters_per_second, 10.2 / 3.6)
         assert result.mode == "A"
         assert result.valid is True
 
-    def test_vtg_differential_mode(self):
-        result = parse_vtg("$GNVTG,054.7,T,034.4,M,005.5,N,010.2,K,D*3E")
-        assert result is not None and result.mode == "D" and result.valid
-
-    def test_vtg_not_valid_mode(self):
-        result = parse_vtg("$GNVTG,054.7,T,034.4,M,005.5,N,010.2,K,N*34")
-        assert result is not None and result.mode == "N" and not result.valid
+    @pytest.mark.parametrize(
+        ("mode", "checksum", "expected_valid"),
+        [
+            pytest.param("A", "3B", True, id="autonomous"),
+            pytest.param("D", "3E", True, id="differential"),
+            pytest.param("N", "34", False, id="not_valid"),
+        ],
+    )
+    def test_vtg_mode_sets_validity(self, mode, checksum, expected_valid):
+        result = parse_vtg(f"$GNVTG,{_VTG_BODY},{mode}*{checksum}")
+        assert result is not None
+        assert result.mode == mode
+        assert result.valid is expected_valid
 
     def test_vtg_stationary_empty_track(self):
         result = parse_vtg("$GNVTG,,T,,M,0.0,N,0.0,K,A*3D")
         assert result is not None
         assert result.track_true_degrees is None
-        assert result.speed_knots == pytest.approx(0.0)
-        assert result.speed_kilometers_per_hour == pytest.approx(0.0)
-        assert result.speed_meters_per_second == pytest.approx(0.0)
+        assert result.speed_knots == 0.0
+        assert result.speed_kilometers_per_hour == 0.0
+        assert result.speed_meters_per_second == 0.0
         assert result.mode == "A" and result.valid
 
     def test_vtg_all_empty_fields(self):
@@ -46,11 +60,17 @@ class TestParseVTG:
         assert result.mode == "N" and not result.valid
 
     def test_vtg_no_mode_indicator(self):
-        result = parse_vtg("$GNVTG,054.7,T,034.4,M,005.5,N,010.2,K*56")
+        result = parse_vtg(f"$GNVTG,{_VTG_BODY}*56")
         assert result is not None and result.mode is None and not result.valid
 
     def test_vtg_invalid_checksum(self):
-        assert parse_vtg("$GNVTG,054.7,T,034.4,M,005.5,N,010.2,K,A*FF") is None
+        assert parse_vtg(f"$GNVTG,{_VTG_BODY},A*FF") is None
+
+    def test_vtg_invalid_checksum_accepted_when_verification_skipped(self):
+        result = parse_vtg(f"$GNVTG,{_VTG_BODY},A*FF", verify_checksum=False)
+        assert result is not None
+        assert result.mode == "A"
+        assert result.speed_knots == 5.5
 
     def test_vtg_malformed_too_few_fields(self):
         assert parse_vtg("$GNVTG,054.7,T*12") is None
@@ -62,27 +82,31 @@ class TestParseVTG:
     def test_vtg_invalid_prefix(self):
         assert parse_vtg("$XXVTG,054.7,T,034.4,M,005.5,N,010.2,K,A*32") is None
 
-    def test_vtg_multi_constellation_prefixes(self):
-        prefixes = [("GP", "25"), ("GN", "3B"), ("GL", "39"),
-                    ("GA", "34"), ("GB", "37"), ("GQ", "24")]
-        for prefix, checksum in prefixes:
-            sentence = f"${prefix}VTG,054.7,T,034.4,M,005.5,N,010.2,K,A*{checksum}"
-            assert parse_vtg(sentence) is not None, f"Failed: {prefix}"
+    @pytest.mark.parametrize(
+        ("prefix", "checksum"),
+        [("GP", "25"), ("GN", "3B"), ("GL", "39"), ("GA", "34"), ("GB", "37"), ("GQ", "24")],
+    )
+    def test_vtg_multi_constellation_prefixes(self, prefix, checksum):
+        assert parse_vtg(f"${prefix}VTG,{_VTG_BODY},A*{checksum}") is not None
 
     def test_vtg_speed_meters_per_second_computed_correctly(self):
         result = parse_vtg("$GNVTG,000.0,T,000.0,M,000.0,N,036.0,K,A*38")
         assert result is not None
-        assert result.speed_kilometers_per_hour == pytest.approx(36.0)
-        assert result.speed_meters_per_second == pytest.approx(10.0)
+        assert result.speed_kilometers_per_hour == 36.0
+        assert_close(result.speed_meters_per_second, 10.0)
 
     def test_vtg_speed_meters_per_second_none_when_kmh_empty(self):
         result = parse_vtg("$GNVTG,054.7,T,034.4,M,005.5,N,,K,A*16")
         assert result is not None and result.speed_meters_per_second is None
 
     def test_vtg_with_crlf(self):
-        sentence = "$GNVTG,054.7,T,034.4,M,005.5,N,010.2,K,A*3B\r\n"
+        sentence = f"$GNVTG,{_VTG_BODY},A*3B\r\n"
         assert parse_vtg(sentence) is not None
 
+    def test_vtg_accepts_bytes(self):
+        result = parse_vtg(_VTG_AUTONOMOUS_BYTES)
+        assert result is not None and result.mode == "A" and result.valid
+
     def test_zedf9p_vtg_moving(self):
         result = parse_vtg("$GNVTG,325.5,T,337.8,M,0.5,N,0.9,K,D*3A")
         assert result is not None and result.mode == "D"
@@ -0,0 +1,65 @@
+"""Controllable stand-ins for the hardware readers used by server tests."""
+
+import queue
+from collections.abc import Iterator
+
+from sensing.gnss import GNSSData
+from sensing.imu import IMUData
+
+
+class ControlledGNSSReader:
+    def __init__(self) -> None:
+        self.message_queue: queue.Queue[GNSSData | None] = queue.Queue()
+
+    def __enter__(self) -> "ControlledGNSSReader":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        pass
+
+    def cancel(self) -> None:
+        """Unblocks the queue wait instantly."""
+        self.message_queue.put(None)
+
+    def __iter__(self) -> Iterator[GNSSData]:
+        while True:
+            # Safe, blocking wait. No fragile CI timeout needed.
+            data = self.message_queue.get()
+            # Drain whatever else is already queued without blocking again.
+            while data is not None:
+                yield data
+                try:
+                    data = self.message_queue.get_nowait()
+                except queue.Empty:
+                    break
+            if data is None:
+                return
+
+
+class ControlledIMUReader:
+    def __init__(self) -> None:
+        self.message_queue: queue.Queue[IMUData | None] = queue.Queue()
+
+    def __enter__(self) -> "ControlledIMUReader":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        pass
+
+    def cancel(self) -> None:
+        """Trigger an OSError simulation on next read."""
+        self.message_queue.put(None)
+
+    def read(self, timeout: float = 1.0) -> IMUData:
+        # Queue.get waits on a condition variable, so put() and cancel() wake
+        # this immediately; the timeout only bounds idle waits. Matching
+        # IMUReader.read's default stops the idle sensor loop from spinning.
+        try:
+            data = self.message_queue.get(timeout=timeout)
+        except queue.Empty as exc:
+            raise TimeoutError() from exc
+
+        if data is None:
+            raise OSError("Simulated hardware disconnect.")
+
+        return data
@@ -1,38 +1,23 @@
-"""Helper factories for server tests."""
+"""Helper factories for server tests.
 
-from sensing.gnss import GNSSData
-from sensing.imu import IMUData
-from sensing.nmea.types import GGAData, VTGData
+The factories are memoized: each distinct call returns one shared instance.
+The sensing dataclasses are not frozen, so tests must not mutate the results.
+"""
 
+import functools
 
-def make_gga() -> GGAData:
-    return GGAData(
-        utc_time="120000.00",
-        latitude_degrees=45.0,
-        longitude_degrees=9.0,
-        fix_quality=1,
-        num_satellites=8,
-        horizontal_dilution_of_precision=1.0,
-        altitude_meters=100.0,
-        geoid_height_meters=50.0,
-        valid=True,
-    )
+from sensing.gnss import GNSSData
+from sensing.imu import IMUData
+from tests.helpers import make_gga, make_vtg
 
 
+@functools.cache
 def make_gnss(*, has_vtg: bool, vtg_valid: bool) -> GNSSData:
-    vtg_data = None
-    if has_vtg:
-        vtg_data = VTGData(
-            track_true_degrees=12.3,
-            speed_knots=4.5,
-            speed_kilometers_per_hour=8.3,
-            speed_meters_per_second=2.3,
-            mode="A" if vtg_valid else "N",
-            valid=vtg_valid,
-        )
+    vtg_data = make_vtg(valid=vtg_valid) if has_vtg else None
     return GNSSData(gga=make_gga(), vtg=vtg_data)
 
 
+@functools.cache
 def make_imu() -> IMUData:
     return IMUData(
         timestamp_ns=1_700_000_000_000_000_000,
@@ -1,27 +1,31 @@
 """Tests for websocket concurrency and connection lifecycle."""
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock
+import contextlib
 
 import pytest
 from fastapi import WebSocketDisconnect
 from fastapi.testclient import TestClient
 
 from server.broadcaster import _enqueue_message
-from server.main import _send_messages_until_disconnect, app
-from tests.server.conftest import ControlledGNSSReader
+from server.main import _send_messages_until_disconnect
+from tests.server.controllers import ControlledGNSSReader
 from tests.server.helpers import make_gnss
 
+_CLIENT_COUNT = 2
 
-def test_multiple_clients(gnss_controller: ControlledGNSSReader) -> None:
-    with (
-        TestClient(app) as client,
-        client.websocket_connect("/ws") as socket_one,
-        client.websocket_connect("/ws") as socket_two,
-    ):
+
+def test_multiple_clients(
+    client: TestClient, gnss_controller: ControlledGNSSReader
+) -> None:
+    with contextlib.ExitStack() as stack:
+        sockets = [
+            stack.enter_context(client.websocket_connect("/ws"))
+            for _ in range(_CLIENT_COUNT)
+        ]
         gnss_controller.message_queue.put(make_gnss(has_vtg=True, vtg_valid=True))
-        assert socket_one.receive_json()["type"] == "gnss"
-        assert socket_two.receive_json()["type"] == "gnss"
+        for socket in sockets:
+            assert socket.receive_json()["type"] == "gnss"
 
 
 def test_drop_oldest_overflow() -> None:
@@ -34,10 +38,11 @@ def test_drop_oldest_overflow() -> None:
     assert message_queue.get_nowait() == "message_three"
 
 
-def test_timeout_disconnect(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_timeout_disconnect(
+    client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
     monkeypatch.setattr("server.main._TIMEOUT_SECONDS", 0.05)
     with (
-        TestClient(app) as client,
         pytest.raises(WebSocketDisconnect) as exc_info,
         client.websocket_connect("/ws") as websocket,
     ):
@@ -50,10 +55,11 @@ def test_client_disconnect_silent() -> None:
         async def send_text(self, _text: str) -> None:
             raise WebSocketDisconnect(code=1000)
 
-    async def _run() -> None:
-        message_queue = MagicMock(spec=asyncio.Queue)
-        message_queue.get = AsyncMock(return_value="message")
+    async def _run() -> asyncio.Queue[str]:
+        message_queue: asyncio.Queue[str] = asyncio.Queue()
+        message_queue.put_nowait("message")
         websocket = MockWebSocket()
         await _send_messages_until_disconnect(message_queue, websocket)  # type: ignore[arg-type]
+        return message_queue
 
-    asyncio.run(_run())
+    assert asyncio.run(_run()).empty()
@@ -1,22 +1,28 @@
 """Tests for websocket payload routing logic."""
 
+import dataclasses
+
 from fastapi.testclient import TestClient
 
-from server.main import app
-from tests.server.conftest import ControlledGNSSReader, ControlledIMUReader
+from server.sensors import _IMU_DECIMATION
+from tests.server.controllers import ControlledGNSSReader, ControlledIMUReader
 from tests.server.helpers import make_gnss, make_imu
 
 
-def test_gnss_without_vtg_yields_null(gnss_controller: ControlledGNSSReader) -> None:
-    with TestClient(app) as client, client.websocket_connect("/ws") as websocket:
+def test_gnss_without_vtg_yields_null(
+    client: TestClient, gnss_controller: ControlledGNSSReader
+) -> None:
+    with client.websocket_connect("/ws") as websocket:
         gnss_controller.message_queue.put(make_gnss(has_vtg=False, vtg_valid=False))
         data = websocket.receive_json()
         assert data["type"] == "gnss"
         assert data["vtg_valid"] is None
 
 
-def test_gnss_with_valid_vtg_yields_true(gnss_controller: ControlledGNSSReader) -> None:
-    with TestClient(app) as client, client.websocket_connect("/ws") as websocket:
+def test_gnss_with_valid_vtg_yields_true(
+    client: TestClient, gnss_controller: ControlledGNSSReader
+) -> None:
+    with client.websocket_connect("/ws") as websocket:
         gnss_controller.message_queue.put(make_gnss(has_vtg=True, vtg_valid=True))
         data = websocket.receive_json()
         assert data["type"] == "gnss"
@@ -24,17 +30,36 @@ def test_gnss_with_valid_vtg_yields_true(gnss_controller: ControlledGNSSReader)
 
 
 def test_gnss_with_invalid_vtg_yields_false(
-    gnss_controller: ControlledGNSSReader,
+    client: TestClient, gnss_controller: ControlledGNSSReader
 ) -> None:
-    with TestClient(app) as client, client.websocket_connect("/ws") as websocket:
+    with client.websocket_connect("/ws") as websocket:
         gnss_controller.message_queue.put(make_gnss(has_vtg=True, vtg_valid=False))
         data = websocket.receive_json()
         assert data["type"] == "gnss"
         assert data["vtg_valid"] is False
 
 
-def test_imu_message_routing(imu_controller: ControlledIMUReader) -> None:
-    with TestClient(app) as client, client.websocket_connect("/ws") as websocket:
+def test_imu_message_routing(
+    client: TestClient, imu_controller: ControlledIMUReader
+) -> None:
+    with client.websocket_connect("/ws") as websocket:
         imu_controller.message_queue.put(make_imu())
         data = websocket.receive_json()
         assert data["type"] == "imu"
+
+
+
+def test_imu_decimation_starts_at_first_reading(
+    client: TestClient, imu_controller: ControlledIMUReader
+) -> None:
+    # Every test gets its own lifespan, so the decimation counter starts at
+    # zero here no matter which IMU tests ran before.
+    readings = [
+        dataclasses.replace(make_imu(), timestamp_ns=index)
+        for index in range(_IMU_DECIMATION + 1)
+    ]
+    with client.websocket_connect("/ws") as websocket:
+        for reading in readings:
+            imu_controller.message_queue.put(reading)
+        timestamps = [websocket.receive_json()["timestamp_ns"] for _ in range(2)]
+    assert timestamps == [0, _IMU_DECIMATION]